@@ -1,5 +1,6 @@
 import os
 from pathlib import Path
+from types import MappingProxyType
 
 from dotenv import load_dotenv
 
@@ -23,7 +24,8 @@ PUBLIC_WSS_URL = os.getenv("PUBLIC_WSS_URL", f"ws://localhost:{WEBSOCKET_PORT}")
 TARGET_LANGUAGE = os.getenv("TARGET_LANGUAGE", "en")
 
 # Supported languages: mapping from Deepgram language codes to DeepL target codes
-LANGUAGE_MAP = {
+# Read-only so nothing mutates them at runtime.
+LANGUAGE_MAP = MappingProxyType({
     "en": "EN-US",
     "es": "ES",
     "fr": "FR",
@@ -31,14 +33,14 @@ LANGUAGE_MAP = {
     "pt": "PT-BR",
     "ja": "JA",
     "zh": "ZH-HANS",
-}
+})
 
 # Per-participant language overrides: participant_id -> target language code
 # Populated at runtime or via config. Participants not listed get TARGET_LANGUAGE.
 PARTICIPANT_LANGUAGES: dict[str, str] = {}
 
 # OpenAI TTS voice per target language
-TTS_VOICES = {
+TTS_VOICES = MappingProxyType({
     "en": "alloy",
     "es": "nova",
     "fr": "nova",
@@ -46,15 +48,24 @@ TTS_VOICES = {
     "pt": "nova",
     "ja": "nova",
     "zh": "nova",
-}
+})
 
 # Deepgram owner/admin key for usage API (optional, needs usage:read scope)
 DEEPGRAM_ADMIN_KEY = os.getenv("DEEPGRAM_ADMIN_KEY", "")
 DEEPGRAM_PROJECT_ID = os.getenv("DEEPGRAM_PROJECT_ID", "")
 
+# Share one multichannel Deepgram connection per session instead of one per
+# participant. Participants beyond ASR_CHANNELS fall back to their own stream.
+# Note Deepgram bills multichannel audio per channel.
+ASR_MULTICHANNEL = os.getenv("ASR_MULTICHANNEL", "").lower() in ("1", "true", "yes")
+ASR_CHANNELS = int(os.getenv("ASR_CHANNELS", "8"))
+
 RECALL_API_BASE = "https://eu-central-1.recall.ai/api/v1"
 
 # Supabase
 SUPABASE_URL = os.environ["SUPABASE_URL"]
 SUPABASE_ANON_KEY = os.environ["SUPABASE_ANON_KEY"]
 SUPABASE_SERVICE_ROLE_KEY = os.environ["SUPABASE_SERVICE_ROLE_KEY"]  # sb_secret_... or legacy service_role JWT
+
+# Worker threads (and HTTP connections) dedicated to blocking Supabase SDK calls
+SUPABASE_POOL_SIZE = int(os.getenv("SUPABASE_POOL_SIZE", "64"))
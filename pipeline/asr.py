@@ -1,23 +1,109 @@
 """Deepgram streaming ASR — converts PCM audio chunks to finalized text.
 
 Uses the Deepgram SDK v5 async WebSocket API (AsyncDeepgramClient).
-Each participant gets their own streaming connection.
+By default each participant gets their own streaming connection
+(ASRStream); with ASR_MULTICHANNEL set, a session's participants share one
+multichannel connection (SessionASR), one channel each.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+from array import array
+from collections import deque
 from typing import Callable, Awaitable
 
 from deepgram import AsyncDeepgramClient
 from deepgram.core.events import EventType
-from deepgram.extensions.types.sockets import ListenV1ResultsEvent
+from deepgram.extensions.types.sockets import ListenV1ControlMessage, ListenV1ResultsEvent
 
 import config
 
 log = logging.getLogger(__name__)
 
+# Recall.ai delivers ~20 ms PCM chunks; coalesce them into ~100 ms frames
+# (16 kHz × 2 bytes × 0.1 s) before forwarding so each WebSocket frame and
+# syscall carries more audio.
+FLUSH_BYTES = 3200
+FLUSH_INTERVAL = 0.1  # max seconds audio may sit in the buffer
+
+# Pool of FLUSH_BYTES-sized frame buffers. A stream fills a pooled buffer in
+# place, sends it, and hands it back, so steady-state audio forwarding
+# allocates no new buffers (≈64 × 3.2 KB held at most).
+PCM_POOL_SIZE = 64
+_pcm_pool: deque[bytearray] = deque(maxlen=PCM_POOL_SIZE)
+
+
+def _acquire_frame() -> bytearray:
+    return _pcm_pool.pop() if _pcm_pool else bytearray(FLUSH_BYTES)
+
+
+def _release_frame(frame: bytearray) -> None:
+    _pcm_pool.append(frame)
+
+
+# Frames waiting to go to Deepgram, per stream. If Deepgram stalls the
+# oldest audio is dropped rather than buffering without bound or blocking
+# the Recall.ai handler.
+SEND_QUEUE_FRAMES = 50  # ~5 s
+
+# Idle per-participant streams kept open for reuse, keyed by (owner bot_id,
+# participant_id), so a participant rejoining the same meeting skips the
+# connect + handshake. A stream is never handed to another participant or
+# bot: Deepgram may still hold its audio and results in flight, which must
+# reach the speaker's own session. Deepgram closes sockets that receive no
+# audio for ~10 s, so pooled streams send KeepAlive every
+# ASR_KEEPALIVE_INTERVAL until they expire.
+ASR_POOL_SIZE = 8
+ASR_POOL_TTL = 30.0
+ASR_KEEPALIVE_INTERVAL = 5.0
+
+_KEEPALIVE = ListenV1ControlMessage(type="KeepAlive")
+_FINALIZE = ListenV1ControlMessage(type="Finalize")
+
+_pool: dict[tuple[str, str], ASRStream] = {}
+
+
+# Multichannel: drop a channel's oldest audio once it falls this far behind
+MULTICHANNEL_MAX_BACKLOG = FLUSH_BYTES * 10  # ~1 s
+
+# One Deepgram client shared by every stream; each connect() call still opens
+# its own WebSocket, so there's no need for a client (and TLS context) apiece.
+_shared_client: AsyncDeepgramClient | None = None
+
+
+def _get_client() -> AsyncDeepgramClient:
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = AsyncDeepgramClient(api_key=config.DEEPGRAM_API_KEY)
+    return _shared_client
+
+
+def _final_transcript(message: ListenV1ResultsEvent) -> tuple[str, str] | None:
+    """Return (text, detected 2-letter language) for a final, non-empty result."""
+    # Only process final results
+    if not message.is_final:
+        return None
+
+    try:
+        alt = message.channel.alternatives[0]
+    except (IndexError, AttributeError):
+        return None
+
+    text = alt.transcript.strip()
+    if not text:
+        return None
+
+    # Detected language from alternatives
+    detected_lang = "en"
+    if alt.languages:
+        detected_lang = alt.languages[0]
+    # Normalise to 2-letter code
+    if "-" in detected_lang:
+        detected_lang = detected_lang.split("-")[0]
+    return text, detected_lang
+
 
 class ASRStream:
     """Wraps a single Deepgram streaming connection for one participant."""
@@ -33,10 +119,18 @@ class ASRStream:
         self.participant_id = participant_id
         self._on_utterance = on_utterance
         self._source_lang = source_lang
-        self._dg = AsyncDeepgramClient(api_key=config.DEEPGRAM_API_KEY)
+        self._dg = _get_client()
         self._socket = None
         self._ctx = None
         self._listen_task: asyncio.Task | None = None
+        self._buf = _acquire_frame()
+        self._buf_len = 0  # bytes of audio currently in self._buf
+        self._last_flush = 0.0
+        self._flush_task: asyncio.Task | None = None
+        self._out: asyncio.Queue[tuple[bytearray, int]] = asyncio.Queue(maxsize=SEND_QUEUE_FRAMES)
+        self._send_task: asyncio.Task | None = None
+        self._idle_task: asyncio.Task | None = None  # set while pooled
+        self.owner = ""  # bot_id of the session using it (pool key, with participant_id)
 
     async def start(self) -> None:
         self._ctx = self._dg.listen.v1.connect(
@@ -56,14 +150,78 @@ class ASRStream:
 
         # Start the background listener that reads from the WebSocket
         self._listen_task = asyncio.create_task(self._socket.start_listening())
+        self._last_flush = asyncio.get_running_loop().time()
+        self._flush_task = asyncio.create_task(self._flush_loop())
+        self._send_task = asyncio.create_task(self._send_loop())
         log.info("ASR started for participant %s", self.participant_id)
 
     async def send_audio(self, pcm_bytes: bytes) -> None:
-        """Send a chunk of S16LE PCM audio to Deepgram."""
-        if self._socket:
-            await self._socket.send_media(pcm_bytes)
+        """Queue a chunk of S16LE PCM audio for Deepgram.
+
+        Chunks are buffered into ~100 ms frames, which a background task
+        sends; this never waits on the network. Another task flushes any
+        remainder so audio is never held longer than FLUSH_INTERVAL.
+        """
+        if not self._socket:
+            return
+        data = memoryview(pcm_bytes)
+        while data:
+            # Same-length slice assignment copies in place without resizing
+            n = min(len(data), FLUSH_BYTES - self._buf_len)
+            self._buf[self._buf_len:self._buf_len + n] = data[:n]
+            self._buf_len += n
+            data = data[n:]
+            if self._buf_len == FLUSH_BYTES:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Move the current frame onto the send queue, dropping the oldest if full."""
+        self._last_flush = asyncio.get_running_loop().time()
+        if not self._buf_len or not self._socket:
+            return
+        frame = (self._buf, self._buf_len)
+        self._buf, self._buf_len = _acquire_frame(), 0
+        if self._out.full():
+            dropped, _ = self._out.get_nowait()
+            self._out.task_done()
+            _release_frame(dropped)
+            log.debug("ASR send queue full for participant %s — dropped a frame", self.participant_id)
+        self._out.put_nowait(frame)
+
+    async def _send_loop(self) -> None:
+        while True:
+            frame, n = await self._out.get()
+            try:
+                await self._socket.send_media(frame if n == FLUSH_BYTES else memoryview(frame)[:n])
+            except Exception:
+                log.exception("ASR send failed for participant %s", self.participant_id)
+            finally:
+                # The frame has been written out, so it can be reused
+                _release_frame(frame)
+                self._out.task_done()
+
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            if self._buf_len and loop.time() - self._last_flush >= FLUSH_INTERVAL:
+                self._flush()
 
     async def close(self) -> None:
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._flush()
+
+        if self._send_task:
+            # Give queued audio a moment to reach Deepgram before hanging up
+            try:
+                await asyncio.wait_for(self._out.join(), timeout=2.0)
+            except asyncio.TimeoutError:
+                pass
+            self._send_task.cancel()
+            self._send_task = None
+
         if self._listen_task:
             self._listen_task.cancel()
             try:
@@ -82,33 +240,346 @@ class ASRStream:
 
         log.info("ASR closed for participant %s", self.participant_id)
 
+    @property
+    def healthy(self) -> bool:
+        return self._socket is not None and self._listen_task is not None and not self._listen_task.done()
+
+    def reset(self, on_utterance: Callable[[str, str], Awaitable[None]]) -> None:
+        """Reattach a pooled stream to its participant's (new) callback."""
+        self._on_utterance = on_utterance
+        self._buf_len = 0
+
     async def _handle_message(self, message) -> None:
-        if not isinstance(message, ListenV1ResultsEvent):
+        # Exact-type lookup; metadata/utterance-end/speech-started events have no entry
+        handler = self._HANDLERS.get(type(message))
+        if handler:
+            await handler(self, message)
+
+    async def _handle_results(self, message: ListenV1ResultsEvent) -> None:
+        result = _final_transcript(message)
+        if result is None:
             return
+        text, detected_lang = result
+
+        log.info("[%s] ASR (%s): %s", self.participant_id, detected_lang, text)
+        await self._on_utterance(self.participant_id, text)
+
+    _HANDLERS = {ListenV1ResultsEvent: _handle_results}
+
+    async def _handle_error(self, error) -> None:
+        log.error("Deepgram error for %s: %s", self.participant_id, error)
+
+
+async def acquire_stream(
+    owner: str,
+    participant_id: str,
+    on_utterance: Callable[[str, str], Awaitable[None]],
+    source_lang: str = "es",
+) -> ASRStream:
+    """Return a started ASRStream for *participant_id* in session *owner*
+    (its bot_id), reusing the one it released earlier if still pooled."""
+    stream = _pool.pop((owner, participant_id), None)
+    if stream is not None:
+        stream._idle_task.cancel()
+        if stream.healthy:
+            stream.reset(on_utterance)
+            log.info("ASR stream reused for participant %s", participant_id)
+            return stream
+        await stream.close()
+
+    stream = ASRStream(participant_id, on_utterance, source_lang=source_lang)
+    stream.owner = owner
+    await stream.start()
+    return stream
+
+
+async def release_stream(stream: ASRStream) -> None:
+    """Pool *stream* for its participant, or close it if it's unhealthy or
+    the pool is full.
+
+    Buffered audio is flushed and Deepgram is asked to Finalize it, so the
+    last words arrive promptly; they go to the same session's callback,
+    the only one the stream ever serves.
+    """
+    stream._flush()
+    key = (stream.owner, stream.participant_id)
+    if not stream.healthy or len(_pool) >= ASR_POOL_SIZE or key in _pool:
+        await stream.close()
+        return
+    try:
+        await asyncio.wait_for(stream._out.join(), timeout=2.0)
+        await stream._socket.send_control(_FINALIZE)
+    except Exception:
+        await stream.close()
+        return
 
-        # Only process final results
-        if not message.is_final:
+    _pool[key] = stream
+    stream._idle_task = asyncio.create_task(_keep_alive(stream))
+
+
+async def _keep_alive(stream: ASRStream) -> None:
+    """While *stream* is pooled: keep its socket open, then close it after ASR_POOL_TTL."""
+    try:
+        for _ in range(int(ASR_POOL_TTL // ASR_KEEPALIVE_INTERVAL)):
+            await asyncio.sleep(ASR_KEEPALIVE_INTERVAL)
+            await stream._socket.send_control(_KEEPALIVE)
+    except Exception:
+        log.warning("ASR KeepAlive failed for pooled stream, closing it")
+    key = (stream.owner, stream.participant_id)
+    if _pool.get(key) is stream:
+        del _pool[key]
+        await stream.close()
+
+
+async def discard_streams(owner: str) -> None:
+    """Close the pooled streams of session *owner* (call when it ends)."""
+    for key in [k for k in _pool if k[0] == owner]:
+        stream = _pool.pop(key)
+        stream._idle_task.cancel()
+        await stream.close()
+
+
+async def close_pool() -> None:
+    """Close every pooled stream (call on shutdown)."""
+    while _pool:
+        _, stream = _pool.popitem()
+        stream._idle_task.cancel()
+        await stream.close()
+
+
+class SessionASR:
+    """One multichannel Deepgram connection shared by a session's participants.
+
+    Each participant is assigned a channel. On a fixed FLUSH_INTERVAL clock
+    their buffered PCM is interleaved into a single N-channel frame (channels
+    without audio are zero-filled), and results are routed back to the
+    participant by ``channel_index``. While every channel is silent the
+    connection is kept open with KeepAlive, and if it drops anyway the clock
+    reconnects it.
+    """
+
+    def __init__(self, on_utterance: Callable[[str, str], Awaitable[None]], source_lang: str = "es", channels: int = 8):
+        """
+        Args:
+            on_utterance: async callback(participant_id, text) fired on each
+                          finalized utterance.
+            source_lang: 2-letter language code for Deepgram transcription.
+            channels: Number of channels (i.e. participants) on the stream.
+        """
+        self.channels = channels
+        self._on_utterance = on_utterance
+        self._source_lang = source_lang
+        self._dg = _get_client()
+        self._socket = None
+        self._ctx = None
+        self._listen_task: asyncio.Task | None = None
+        self._clock_task: asyncio.Task | None = None
+        self._reconnect_at = 0.0  # earliest loop time for the next reconnect attempt
+        # Last participant on each channel — kept after they leave so their
+        # final in-flight results are still attributed correctly
+        self._participants: list[str | None] = [None] * channels
+        self._in_use = [False] * channels
+        # Per-channel audio, always a whole number of 16-bit samples; a chunk
+        # ending mid-sample leaves its last byte in _carry for the next one
+        self._bufs = [bytearray() for _ in range(channels)]
+        self._carry: list[bytes] = [b""] * channels
+        # One interleaved frame, reused every tick (see _interleave)
+        self._frame = array("h", bytes(FLUSH_BYTES * channels))
+        self._silence = array("h", bytes(FLUSH_BYTES * channels))
+
+    async def start(self) -> None:
+        await self._connect()
+        self._clock_task = asyncio.create_task(self._clock())
+        log.info("Multichannel ASR started (%d channels)", self.channels)
+
+    async def _connect(self) -> None:
+        self._ctx = self._dg.listen.v1.connect(
+            model="nova-2",
+            language=self._source_lang,
+            punctuate="true",
+            interim_results="false",
+            encoding="linear16",
+            sample_rate="16000",
+            channels=str(self.channels),
+            multichannel="true",
+        )
+        self._socket = await self._ctx.__aenter__()
+
+        self._socket.on(EventType.MESSAGE, self._handle_message)
+        self._socket.on(EventType.ERROR, self._handle_error)
+
+        self._listen_task = asyncio.create_task(self._socket.start_listening())
+
+    async def _disconnect(self) -> None:
+        if self._listen_task:
+            self._listen_task.cancel()
+            try:
+                await self._listen_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listen_task = None
+
+        if self._ctx:
+            try:
+                await self._ctx.__aexit__(None, None, None)
+            except Exception:
+                pass
+            self._ctx = None
+            self._socket = None
+
+    @property
+    def healthy(self) -> bool:
+        return self._socket is not None and self._listen_task is not None and not self._listen_task.done()
+
+    async def _reconnect(self) -> None:
+        """Replace a dropped connection, at most once per ASR_KEEPALIVE_INTERVAL."""
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._reconnect_at:
             return
+        self._reconnect_at = loop.time() + ASR_KEEPALIVE_INTERVAL
+        log.warning("Multichannel ASR connection lost, reconnecting")
+        await self._disconnect()
+        try:
+            await self._connect()
+        except Exception:
+            log.exception("Multichannel ASR reconnect failed")
+            await self._disconnect()
 
+    def channel(self, participant_id: str) -> ASRChannel | None:
+        """Assign *participant_id* a free channel, or return None if all are taken."""
+        try:
+            index = self._in_use.index(False)
+        except ValueError:
+            return None
+        self._in_use[index] = True
+        self._participants[index] = participant_id
+        self._bufs[index].clear()
+        self._carry[index] = b""
+        log.info("ASR channel %d assigned to participant %s", index, participant_id)
+        return ASRChannel(self, index, participant_id)
+
+    def _push(self, index: int, pcm_bytes: bytes) -> None:
+        buf = self._bufs[index]
+        data = memoryview(pcm_bytes)
+        if self._carry[index] and data:
+            # Complete the sample split across the previous chunk
+            buf += self._carry[index]
+            buf.append(data[0])
+            data = data[1:]
+            self._carry[index] = b""
+        if len(data) & 1:
+            self._carry[index] = bytes(data[-1:])
+            data = data[:-1]
+        buf += data
+        # MULTICHANNEL_MAX_BACKLOG is even, so trimming keeps samples aligned
+        if len(buf) > MULTICHANNEL_MAX_BACKLOG:
+            del buf[:len(buf) - MULTICHANNEL_MAX_BACKLOG]
+
+    def _release(self, index: int) -> None:
+        self._in_use[index] = False
+
+    def _interleave(self) -> memoryview:
+        """Take up to FLUSH_BYTES from every channel and interleave them into one frame.
+
+        The returned view is of a reused buffer; it is valid until the next call.
+        """
+        step = self.channels
+        frame = self._frame
+        frame[:] = self._silence  # same length, so this zero-fills in place
+        for index, buf in enumerate(self._bufs):
+            if not buf:
+                continue
+            take = min(len(buf), FLUSH_BYTES)  # even: _push() keeps whole samples
+            samples = array("h", buf[:take])
+            del buf[:take]
+            frame[index:index + len(samples) * step:step] = samples
+        return memoryview(frame).cast("B")
+
+    async def _clock(self) -> None:
+        loop = asyncio.get_running_loop()
+        started = last_sent = loop.time()
+        frames = 0
+        while True:
+            await asyncio.sleep(FLUSH_INTERVAL)
+            if not self.healthy:
+                # Audio keeps buffering (bounded by MULTICHANNEL_MAX_BACKLOG)
+                await self._reconnect()
+                if not self.healthy:
+                    continue
+            # Catch up on frames missed to timer drift so channels don't fall behind
+            due = int((loop.time() - started) / FLUSH_INTERVAL)
+            while frames < due:
+                frames += 1
+                if not any(self._bufs):
+                    continue
+                try:
+                    await self._socket.send_media(self._interleave())
+                    last_sent = loop.time()
+                except Exception:
+                    log.exception("Multichannel ASR send failed")
+            # Everyone is silent: keep Deepgram from closing the idle socket
+            if loop.time() - last_sent >= ASR_KEEPALIVE_INTERVAL:
+                last_sent = loop.time()
+                try:
+                    await self._socket.send_control(_KEEPALIVE)
+                except Exception:
+                    log.warning("Multichannel ASR KeepAlive failed")
+
+    async def close(self) -> None:
+        if self._clock_task:
+            self._clock_task.cancel()
+            self._clock_task = None
         try:
-            alt = message.channel.alternatives[0]
-        except (IndexError, AttributeError):
+            if self._socket and any(self._bufs):
+                await self._socket.send_media(self._interleave())
+        except Exception:
+            pass
+
+        await self._disconnect()
+        log.info("Multichannel ASR closed")
+
+    async def _handle_message(self, message) -> None:
+        handler = self._HANDLERS.get(type(message))
+        if handler:
+            await handler(self, message)
+
+    async def _handle_results(self, message: ListenV1ResultsEvent) -> None:
+        result = _final_transcript(message)
+        if result is None:
             return
+        text, detected_lang = result
 
-        text = alt.transcript.strip()
-        if not text:
+        index = message.channel_index[0] if message.channel_index else 0
+        if not 0 <= index < self.channels:
+            return
+        participant_id = self._participants[index]
+        if participant_id is None:
             return
 
-        # Detected language from alternatives
-        detected_lang = "en"
-        if alt.languages:
-            detected_lang = alt.languages[0]
-        # Normalise to 2-letter code
-        if "-" in detected_lang:
-            detected_lang = detected_lang.split("-")[0]
+        log.info("[%s] ASR ch%d (%s): %s", participant_id, index, detected_lang, text)
+        await self._on_utterance(participant_id, text)
 
-        log.info("[%s] ASR (%s): %s", self.participant_id, detected_lang, text)
-        await self._on_utterance(self.participant_id, text)
+    _HANDLERS = {ListenV1ResultsEvent: _handle_results}
 
     async def _handle_error(self, error) -> None:
-        log.error("Deepgram error for %s: %s", self.participant_id, error)
+        log.error("Deepgram multichannel error: %s", error)
+
+
+class ASRChannel:
+    """A participant's channel on a SessionASR; same interface as ASRStream."""
+
+    def __init__(self, session_asr: SessionASR, index: int, participant_id: str):
+        self.participant_id = participant_id
+        self.index = index
+        self._asr = session_asr
+        self._closed = False
+
+    async def send_audio(self, pcm_bytes: bytes) -> None:
+        if not self._closed:
+            self._asr._push(self.index, pcm_bytes)
+
+    async def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._asr._release(self.index)
+            log.info("ASR channel %d released by participant %s", self.index, self.participant_id)
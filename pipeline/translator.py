@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import OrderedDict
+from typing import Callable
 
 import httpx
 
@@ -13,44 +16,197 @@ log = logging.getLogger(__name__)
 DEEPL_API_URL = "https://api-free.deepl.com/v2/translate"
 # Switch to "https://api.deepl.com/v2/translate" for a paid plan.
 
-
-async def translate(text: str, target_lang: str, source_lang: str | None = None) -> str | None:
+# Shared HTTP/2 client — concurrent translate() calls multiplex over one
+# keep-alive connection instead of a TLS handshake per utterance.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=10,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _client
+
+
+async def close() -> None:
+    """Close the shared HTTP client (call on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+# Micro-batching: DeepL's ``text`` field is an array, so utterances that
+# arrive close together for the same language pair share one POST.
+BATCH_WINDOW = 0.075  # seconds to wait for more texts before flushing
+BATCH_MAX_TEXTS = 25
+
+
+class _TranslationBatcher:
+    """Coalesces translate() calls for one (target, source) language pair."""
+
+    def __init__(self, target_lang: str, source_lang: str | None):
+        self.target_lang = target_lang
+        # Resolve DeepL language codes once rather than on every flush
+        self.deepl_target = config.LANGUAGE_MAP.get(target_lang, target_lang.upper())
+        self.deepl_source = source_lang.upper() if source_lang else None
+        self._pending: list[tuple[str, asyncio.Future[str | None]]] = []
+        self._full = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def submit(self, text: str) -> str | None:
+        future: asyncio.Future[str | None] = asyncio.get_running_loop().create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= BATCH_MAX_TEXTS:
+            self._full.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        batch: list[tuple[str, asyncio.Future[str | None]]] = []
+        try:
+            while self._pending:
+                try:
+                    await asyncio.wait_for(self._full.wait(), timeout=BATCH_WINDOW)
+                except asyncio.TimeoutError:
+                    pass
+                self._full.clear()
+                batch = self._pending[:BATCH_MAX_TEXTS]
+                del self._pending[:BATCH_MAX_TEXTS]
+                if len(self._pending) >= BATCH_MAX_TEXTS:
+                    self._full.set()
+
+                try:
+                    results = await _translate_batch(
+                        [text for text, _ in batch],
+                        self.target_lang, self.deepl_target, self.deepl_source,
+                    )
+                except Exception as exc:
+                    for _, future in batch:
+                        if not future.done():
+                            future.set_exception(exc)
+                    continue
+
+                for i, (_, future) in enumerate(batch):
+                    if not future.done():
+                        future.set_result(results[i] if i < len(results) else None)
+        finally:
+            # If cancelled, nothing else will resolve these; a submit() left
+            # waiting would stall its utterance handler forever
+            for _, future in batch + self._pending:
+                if not future.done():
+                    future.set_result(None)
+            self._pending.clear()
+
+
+# (target_lang, source_lang) → batcher
+_batchers: dict[tuple[str, str | None], _TranslationBatcher] = {}
+
+# LRU cache of successful translations: (target, source, normalized text) →
+# translated text. Greetings and stock phrases repeat all meeting long.
+CACHE_MAX_ENTRIES = 1024
+CACHE_MAX_TEXT_LEN = 200  # long utterances rarely repeat — don't cache them
+
+_cache: OrderedDict[tuple[str, str | None, str], str] = OrderedDict()
+
+
+async def translate(
+    text: str,
+    target_lang: str,
+    source_lang: str | None = None,
+    on_billed: Callable[[int], None] | None = None,
+) -> str | None:
     """Translate *text* to *target_lang* via DeepL.
 
+    Calls made within a short window for the same language pair are sent
+    to DeepL together in a single request, and repeated short phrases are
+    served from an in-process LRU cache.
+
     Args:
         text: Source text.
         target_lang: 2-letter language code (e.g. "en", "es").
         source_lang: Optional source language hint. ``None`` = auto-detect.
+        on_billed: Called with the character count when *text* is actually
+            sent to DeepL (not for cache hits or skipped translations).
 
     Returns:
         Translated string, or ``None`` if translation was skipped or failed.
     """
-    deepl_target = config.LANGUAGE_MAP.get(target_lang, target_lang.upper())
+    # Nothing to do when the caller already knows the text is in the target
+    # language — skip the DeepL round trip entirely.
+    if source_lang and source_lang.lower() == target_lang.lower():
+        return None
+
+    cache_key = (target_lang, source_lang, text.strip().lower())
+    cacheable = len(text) <= CACHE_MAX_TEXT_LEN
+    if cacheable:
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            _cache.move_to_end(cache_key)
+            log.info("Translation cache hit (%s): %s → %s", target_lang, text, cached)
+            return cached
+
+    key = (target_lang, source_lang)
+    batcher = _batchers.get(key)
+    if batcher is None:
+        batcher = _batchers[key] = _TranslationBatcher(target_lang, source_lang)
+    if on_billed is not None:
+        on_billed(len(text))
+    translated = await batcher.submit(text)
+
+    # None means skipped or failed — only remember real translations
+    if cacheable and translated is not None:
+        _cache[cache_key] = translated
+        if len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return translated
+
 
+async def _translate_batch(
+    texts: list[str], target_lang: str, deepl_target: str, deepl_source: str | None = None
+) -> list[str | None]:
+    """Translate several texts in one DeepL request, preserving order."""
     params: dict = {
-        "text": [text],
+        "text": texts,
         "target_lang": deepl_target,
     }
-    if source_lang:
-        params["source_lang"] = source_lang.upper()
+    if deepl_source:
+        params["source_lang"] = deepl_source
 
     headers = {"Authorization": f"DeepL-Auth-Key {config.DEEPL_API_KEY}"}
 
-    async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.post(DEEPL_API_URL, json=params, headers=headers)
+    resp = await _get_client().post(DEEPL_API_URL, json=params, headers=headers)
 
     if resp.status_code != 200:
         log.error("DeepL error %s: %s", resp.status_code, resp.text)
-        return None
+        return [None] * len(texts)
 
     data = resp.json()
-    translated = data["translations"][0]["text"]
-    detected = data["translations"][0].get("detected_source_language", "??").lower()
-
-    # If the detected source language already matches the target, skip.
-    if detected == target_lang:
-        log.info("Skipping translation — already in %s", target_lang)
-        return None
-
-    log.info("Translated (%s→%s): %s → %s", detected, target_lang, text, translated)
-    return translated
+    if len(data["translations"]) != len(texts):
+        log.error("DeepL returned %d translations for %d texts",
+                  len(data["translations"]), len(texts))
+        return [None] * len(texts)
+    results: list[str | None] = []
+    for text, item in zip(texts, data["translations"]):
+        translated = item["text"]
+        detected = item.get("detected_source_language", "??").lower()
+
+        # If the detected source language already matches the target, skip.
+        if detected == target_lang:
+            log.info("Skipping translation — already in %s", target_lang)
+            results.append(None)
+            continue
+
+        # Nothing to speak — don't send an empty clip through TTS
+        if not translated.strip():
+            results.append(None)
+            continue
+
+        log.info("Translated (%s→%s): %s → %s", detected, target_lang, text, translated)
+        results.append(translated)
+    return results
@@ -2,9 +2,14 @@
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import logging
+import re
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Callable
 
+import pybase64
 from openai import AsyncOpenAI
 
 import config
@@ -13,10 +18,194 @@ log = logging.getLogger(__name__)
 
 _client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
 
+# Size of the MP3 slices yielded by synthesize_stream()
+STREAM_CHUNK_SIZE = 4096
+
+# synthesize_sentences() splits at sentence ends followed by whitespace,
+# merging fragments shorter than MIN_SENTENCE_LEN into the next sentence
+_SENTENCE_END = re.compile(r"(?<=[.!?。！？])\s+")
+MIN_SENTENCE_LEN = 20
+
+# LRU cache of recent TTS output: (lang, voice, normalized text) → MP3 bytes.
+# Stock phrases ("Yes", "Thank you") recur constantly in meetings, so a hit
+# skips the whole OpenAI round trip. Bounded by entry count and total size.
+CACHE_MAX_ENTRIES = 512
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+CACHE_MAX_TEXT_LEN = 200  # long utterances rarely repeat — don't cache them
+CACHE_STATS_INTERVAL = 60.0
+
+_cache: OrderedDict[tuple[str, str, str], bytes] = OrderedDict()
+_cache_bytes = 0
+_cache_hits = 0
+_cache_misses = 0
+_cache_stats_logged = 0.0
+
+# In-flight requests: concurrent callers asking for the same phrase await the
+# first caller's future instead of issuing a duplicate OpenAI request.
+_inflight: dict[tuple[str, str, str], asyncio.Future[bytes]] = {}
+
+
+def _cache_get(key: tuple[str, str, str]) -> bytes | None:
+    global _cache_hits, _cache_misses
+    mp3_bytes = _cache.get(key)
+    if mp3_bytes is None:
+        _cache_misses += 1
+        return None
+    _cache.move_to_end(key)
+    _cache_hits += 1
+    return mp3_bytes
+
+
+def _cache_put(key: tuple[str, str, str], mp3_bytes: bytes) -> None:
+    global _cache_bytes
+    if key in _cache:
+        return
+    _cache[key] = mp3_bytes
+    _cache_bytes += len(mp3_bytes)
+    while len(_cache) > CACHE_MAX_ENTRIES or _cache_bytes > CACHE_MAX_BYTES:
+        _, evicted = _cache.popitem(last=False)
+        _cache_bytes -= len(evicted)
+
+
+def _log_cache_stats() -> None:
+    global _cache_stats_logged
+    now = time.monotonic()
+    if now - _cache_stats_logged < CACHE_STATS_INTERVAL:
+        return
+    _cache_stats_logged = now
+    log.info("TTS cache: %d hits, %d misses, %d entries (%.1f MB)",
+             _cache_hits, _cache_misses, len(_cache), _cache_bytes / 1_000_000)
+
+
+async def synthesize_stream(
+    text: str, lang: str, on_billed: Callable[[int], None] | None = None
+) -> AsyncIterator[bytes]:
+    """Convert *text* to speech, yielding MP3 data as it arrives from OpenAI.
+
+    Cached phrases, and phrases already being synthesized for another
+    caller, are yielded as a single chunk once available.
+
+    Args:
+        text: Text to speak.
+        lang: 2-letter target language code, used to pick a voice.
+        on_billed: Called with the character count when *text* is actually
+            sent to OpenAI (not for cache hits or coalesced requests).
+
+    Yields:
+        Consecutive slices of one MP3 file.
+    """
+    voice = config.TTS_VOICES.get(lang, "alloy")
+
+    key = (lang, voice, text.strip().lower())
+    cacheable = len(text) <= CACHE_MAX_TEXT_LEN
+    if cacheable:
+        cached = _cache_get(key)
+        _log_cache_stats()
+        if cached is not None:
+            log.info("TTS cache hit: %d chars (voice=%s)", len(text), voice)
+            yield cached
+            return
+
+    pending = _inflight.get(key)
+    if pending is not None:
+        log.info("TTS coalesced: %d chars (voice=%s)", len(text), voice)
+        yield await asyncio.shield(pending)
+        return
+
+    future: asyncio.Future[bytes] = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    if on_billed is not None:
+        on_billed(len(text))
+    try:
+        chunks: list[bytes] = []
+        async with _client.audio.speech.with_streaming_response.create(
+            model="tts-1",
+            voice=voice,
+            input=text,
+            response_format="mp3",
+        ) as response:
+            async for chunk in response.iter_bytes(STREAM_CHUNK_SIZE):
+                chunks.append(chunk)
+                yield chunk
+
+        mp3_bytes = b"".join(chunks)
+        log.info("TTS: %d chars → %d bytes MP3 (voice=%s)", len(text), len(mp3_bytes), voice)
+        if cacheable:
+            _cache_put(key, mp3_bytes)
+        future.set_result(mp3_bytes)
+    except Exception as exc:
+        future.set_exception(exc)
+        # Mark retrieved so a failure nobody else awaited doesn't log a warning
+        future.exception()
+        raise
+    except BaseException:
+        # Cancelled, or the consumer stopped iterating early
+        future.cancel()
+        raise
+    finally:
+        _inflight.pop(key, None)
+
+
+def _split_sentences(text: str) -> list[str]:
+    sentences: list[str] = []
+    pending = ""
+    for piece in _SENTENCE_END.split(text.strip()):
+        pending = f"{pending} {piece}" if pending else piece
+        if len(pending) >= MIN_SENTENCE_LEN:
+            sentences.append(pending)
+            pending = ""
+    if pending:
+        if sentences:
+            sentences[-1] += " " + pending
+        else:
+            sentences.append(pending)
+    return sentences
+
+
+async def _synthesize_bytes(
+    text: str, lang: str, on_billed: Callable[[int], None] | None = None
+) -> bytes:
+    return b"".join([chunk async for chunk in synthesize_stream(text, lang, on_billed)])
+
+
+async def synthesize_sentences(
+    text: str, lang: str, on_billed: Callable[[int], None] | None = None
+) -> AsyncIterator[bytes]:
+    """Like synthesize_stream(), but multi-sentence text is split up so the
+    first sentence streams immediately while the rest are synthesized in
+    parallel; they follow in order. MP3 frames concatenate cleanly.
+
+    Short sentences also make better TTS cache entries than whole utterances.
+    Sentences are cached and coalesced individually, so *on_billed* is
+    called once per sentence actually sent to OpenAI.
+    """
+    sentences = _split_sentences(text)
+    if len(sentences) <= 1:
+        async for chunk in synthesize_stream(text, lang, on_billed):
+            yield chunk
+        return
+
+    rest = [asyncio.create_task(_synthesize_bytes(s, lang, on_billed)) for s in sentences[1:]]
+    try:
+        async for chunk in synthesize_stream(sentences[0], lang, on_billed):
+            yield chunk
+        for task in rest:
+            mp3_bytes = await task
+            for i in range(0, len(mp3_bytes), STREAM_CHUNK_SIZE):
+                yield mp3_bytes[i:i + STREAM_CHUNK_SIZE]
+    finally:
+        for task in rest:
+            task.cancel()
+
 
 async def synthesize(text: str, lang: str) -> str:
     """Convert *text* to speech and return base64-encoded MP3.
 
+    Only for APIs that take base64 (e.g. Recall.ai output_audio); the
+    listener and recording paths use synthesize_stream() and raw bytes.
+    Repeated short phrases are served from an in-process LRU cache, and
+    concurrent requests for the same phrase share a single API call.
+
     Args:
         text: Text to speak.
         lang: 2-letter target language code, used to pick a voice.
@@ -24,16 +213,5 @@ async def synthesize(text: str, lang: str) -> str:
     Returns:
         Base64-encoded MP3 audio string.
     """
-    voice = config.TTS_VOICES.get(lang, "alloy")
-
-    response = await _client.audio.speech.create(
-        model="tts-1",
-        voice=voice,
-        input=text,
-        response_format="mp3",
-    )
-
-    mp3_bytes = response.content
-    encoded = base64.b64encode(mp3_bytes).decode()
-    log.info("TTS: %d chars → %d bytes MP3 (voice=%s)", len(text), len(mp3_bytes), voice)
-    return encoded
+    mp3_bytes = b"".join([chunk async for chunk in synthesize_stream(text, lang)])
+    return pybase64.b64encode(mp3_bytes).decode()
@@ -14,6 +14,30 @@ import config
 
 log = logging.getLogger(__name__)
 
+# Shared HTTP/2 client — keeps the TLS connection to Recall.ai alive across
+# calls instead of paying a fresh handshake per request. Created lazily so it
+# binds to the running event loop.
+_client: httpx.AsyncClient | None = None
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=15,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _client
+
+
+async def close() -> None:
+    """Close the shared HTTP client (call on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
 
 async def create_bot(meeting_url: str, websocket_url: str, bot_name: str = "Translator Bot") -> str:
     """Deploy a Recall.ai bot to *meeting_url*.
@@ -57,12 +81,12 @@ async def create_bot(meeting_url: str, websocket_url: str, bot_name: str = "Tran
         "Content-Type": "application/json",
     }
 
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.post(
-            f"{config.RECALL_API_BASE}/bot",
-            json=payload,
-            headers=headers,
-        )
+    resp = await _get_client().post(
+        f"{config.RECALL_API_BASE}/bot",
+        json=payload,
+        headers=headers,
+        timeout=30,
+    )
 
     resp.raise_for_status()
     data = resp.json()
@@ -75,11 +99,10 @@ async def stop_bot(bot_id: str) -> None:
     """Remove the bot from the meeting."""
     headers = {"Authorization": f"Token {config.RECALL_API_KEY}"}
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.post(
-            f"{config.RECALL_API_BASE}/bot/{bot_id}/leave_call",
-            headers=headers,
-        )
+    resp = await _get_client().post(
+        f"{config.RECALL_API_BASE}/bot/{bot_id}/leave_call",
+        headers=headers,
+    )
 
     resp.raise_for_status()
     log.info("Bot stopped: %s", bot_id)
@@ -96,12 +119,11 @@ async def send_audio(bot_id: str, mp3_base64: str) -> None:
         "b64_data": mp3_base64,
     }
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.post(
-            f"{config.RECALL_API_BASE}/bot/{bot_id}/output_audio",
-            json=payload,
-            headers=headers,
-        )
+    resp = await _get_client().post(
+        f"{config.RECALL_API_BASE}/bot/{bot_id}/output_audio",
+        json=payload,
+        headers=headers,
+    )
 
     if resp.status_code not in (200, 201):
         log.error("send_audio failed %s: %s", resp.status_code, resp.text)
@@ -121,6 +143,13 @@ async def _cli() -> None:
 
     cmd = sys.argv[1]
 
+    try:
+        await _run_cli_command(cmd)
+    finally:
+        await close()
+
+
+async def _run_cli_command(cmd: str) -> None:
     if cmd == "create":
         meeting_url = sys.argv[2]
         ws_url = sys.argv[3] if len(sys.argv) > 3 else f"ws://localhost:{config.WEBSOCKET_PORT}"
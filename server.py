@@ -7,33 +7,43 @@ Recall.ai bots connect on the default path for audio streaming.
 from __future__ import annotations
 
 import asyncio
-import base64
-import json
+import email.utils
+import gzip
+import hashlib
+import itertools
 import logging
 import os
+import re
 import signal
 import subprocess
 import tempfile
-import time
+from collections import deque
 from datetime import datetime, timezone, timedelta
+from http import HTTPStatus
 from dataclasses import dataclass, field
-from typing import Any
-from urllib.parse import urlparse, parse_qs
+from typing import IO, Any, AsyncIterator
+from urllib.parse import unquote_plus
 
 import httpx
+import msgspec
+import orjson
 
 import websockets
 from websockets.asyncio.server import serve, ServerConnection
+from websockets.datastructures import Headers
 from websockets.http11 import Request, Response
 
 from anthropic import AsyncAnthropic
 
 import config
 import supabase_client
-from pipeline.asr import ASRStream
-from pipeline.translator import translate
-from pipeline.tts import synthesize
-from recall_client import create_bot, stop_bot
+from pipeline.asr import (
+    ASRStream, ASRChannel, SessionASR, acquire_stream, release_stream, discard_streams,
+    close_pool as close_asr_pool,
+)
+from pipeline.translator import translate, close as close_translator
+from pipeline.tts import synthesize_sentences
+from recall_client import create_bot, stop_bot, close as close_recall
 
 _anthropic = AsyncAnthropic(api_key=config.ANTHROPIC_API_KEY)
 from web_ui import HTML_PAGE, LISTEN_PAGE, MEETING_PAGE
@@ -47,6 +57,22 @@ log = logging.getLogger(__name__)
 
 # ── Per-bot session state ──────────────────────────────────────────────
 
+# Recording text buffers stay in memory up to this size, then spill to a
+# temporary file, so a long meeting doesn't hold its whole transcript in RAM
+RECORDING_SPOOL_BYTES = 1024 * 1024
+
+
+def _spool() -> IO[bytes]:
+    return tempfile.SpooledTemporaryFile(max_size=RECORDING_SPOOL_BYTES, mode="w+b")
+
+
+def _read_spool(fp: IO[bytes]) -> bytes:
+    pos = fp.tell()
+    fp.seek(0)
+    text = fp.read()
+    fp.seek(pos)
+    return text
+
 
 @dataclass
 class BotSession:
@@ -57,13 +83,24 @@ class BotSession:
     user_id: str = ""
     mode: str = "translate"  # "translate" | "notes" | "both"
     status: str = "starting"  # starting | in_call | stopped
-    asr_streams: dict[str, ASRStream] = field(default_factory=dict)
+    asr_streams: dict[str, ASRStream | ASRChannel] = field(default_factory=dict)
+    session_asr: SessionASR | None = None  # shared multichannel stream (ASR_MULTICHANNEL)
+    # (raw Recall participant id, its stream) for the last audio frame;
+    # consecutive frames from the same speaker skip the str()/dict lookups.
+    # Cleared whenever a stream is closed.
+    last_audio_source: tuple[int | str, ASRStream | ASRChannel] | None = None
     participant_names: dict[str, str] = field(default_factory=dict)
-    recording_start: float = 0.0
+    recording_start: float = 0.0  # _session_clock() reading
     clip_count: int = 0
     audio_offset: float = 0.0  # cumulative audio seconds for SRT timing
-    srt_buffer: str = ""
-    transcript_buffer: str = ""
+    # Append handles for subtitles.srt / transcript.jsonl (UTF-8); writes
+    # are amortized O(1) and large recordings spill to disk (see _spool())
+    srt_fp: IO[bytes] = field(default_factory=_spool)
+    transcript_fp: IO[bytes] = field(default_factory=_spool)
+    # (clip number, MP3) awaiting upload by the session's clip flusher task
+    pending_clips: deque[tuple[int, bytes]] = field(default_factory=deque)
+    clip_flusher: asyncio.Task | None = None
+    clips_done: asyncio.Event = field(default_factory=asyncio.Event)  # stops the flusher
     # Cost tracking (accumulated per utterance)
     tts_chars: int = 0          # total characters sent to OpenAI TTS
     deepl_chars: int = 0        # total characters sent to DeepL
@@ -71,20 +108,208 @@ class BotSession:
     llm_input_tokens: int = 0
     llm_output_tokens: int = 0
 
+    @property
+    def srt_bytes(self) -> bytes:
+        return _read_spool(self.srt_fp)
+
+    @property
+    def transcript_bytes(self) -> bytes:
+        return _read_spool(self.transcript_fp)
+
+    # Writes after close_recording() (an utterance finishing once the
+    # session's files were saved) are dropped
+    def append_srt(self, data: bytes) -> None:
+        if not self.srt_fp.closed:
+            self.srt_fp.write(data)
+
+    def append_transcript(self, entry: dict) -> None:
+        if not self.transcript_fp.closed:
+            self.transcript_fp.write(orjson.dumps(entry) + b"\n")
+
+    def close_recording(self) -> None:
+        """Release the spools (temp files, once past RECORDING_SPOOL_BYTES)."""
+        self.srt_fp.close()
+        self.transcript_fp.close()
+
+    # Emptiness checks without reading the spools back
+    @property
+    def has_subtitles(self) -> bool:
+        return self.srt_fp.tell() > 0
+
+    @property
+    def has_transcript(self) -> bool:
+        return self.transcript_fp.tell() > 0
+
+    def add_deepl_chars(self, chars: int) -> None:
+        """translate() callback: *chars* were sent to DeepL."""
+        self.deepl_chars += chars
+
+    def add_tts_chars(self, chars: int) -> None:
+        """synthesize_sentences() callback: *chars* were sent to OpenAI TTS."""
+        self.tts_chars += chars
+
+    async def on_utterance(self, participant_id: str, text: str) -> None:
+        """ASR callback: handle a finalized utterance according to the session mode."""
+        if self.status == "stopped":
+            # A late Deepgram result; the recording has already been saved
+            log.debug("Dropping utterance for stopped session %s", self.bot_id[:8])
+            return
+        if self.mode == "notes":
+            await handle_utterance_notes(self, participant_id, text)
+        elif self.mode == "both":
+            await handle_utterance_both(self, participant_id, text)
+        else:
+            await handle_utterance(self, participant_id, text)
+
 
 # bot_id → BotSession
 bot_sessions: dict[str, BotSession] = {}
 
-# Connected management UI WebSocket clients: ws → {user_id, is_admin}
-mgmt_clients: dict[ServerConnection, dict] = {}
+# user_id → that user's entries of bot_sessions, in start order, so status
+# snapshots don't scan every session. Mutate both via _add_session() and
+# _remove_session().
+_sessions_by_user: dict[str, dict[str, BotSession]] = {}
+
+
+def _add_session(session: BotSession) -> None:
+    bot_sessions[session.bot_id] = session
+    _sessions_by_user.setdefault(session.user_id, {})[session.bot_id] = session
+    _mark_status_dirty()
+
+
+def _remove_session(bot_id: str) -> None:
+    session = bot_sessions.pop(bot_id, None)
+    if session is None:
+        return
+    # Its transcript and subtitles have been read for upload by now
+    session.close_recording()
+    user_sessions = _sessions_by_user.get(session.user_id, {})
+    user_sessions.pop(bot_id, None)
+    if not user_sessions:
+        _sessions_by_user.pop(session.user_id, None)
+    _mark_status_dirty()
+
+# Broadcasts are queued per client and sent by that client's writer task;
+# a client this many messages behind is disconnected (see Client.disconnect).
+SEND_QUEUE_SIZE = 32
+
+# Fire-and-forget close tasks for dropped clients; holding a reference keeps
+# them from being garbage-collected before the close handshake finishes.
+_closing_tasks: set[asyncio.Task] = set()
+
+
+class TextFrame(bytes):
+    """Already UTF-8 encoded JSON, sent as a text frame.
 
-# target_lang → set of WebSocket connections (listener browsers)
-listener_clients: dict[str, set[ServerConnection]] = {}
+    Broadcasts are serialized once with orjson; queuing a TextFrame instead
+    of a str spares websockets re-encoding the message for every client.
+    """
+    __slots__ = ()
+
+
+@dataclass(eq=False)
+class Client:
+    """A browser WebSocket with its own send queue and writer task, so a slow
+    client only ever delays itself."""
+    ws: ServerConnection
+    queue: asyncio.Queue[str | bytes] = field(
+        default_factory=lambda: asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+    )
+    writer: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self.writer = asyncio.create_task(self._write_loop())
+
+    def stop(self) -> None:
+        if self.writer:
+            self.writer.cancel()
+            self.writer = None
+
+    def disconnect(self, reason: str) -> None:
+        """Drop a client that can't keep up; the web UI reconnects by itself."""
+        if self.writer is None:
+            return  # already stopped
+        self.stop()
+        task = asyncio.create_task(self.ws.close(1013, reason))
+        _closing_tasks.add(task)
+        task.add_done_callback(_closing_tasks.discard)
+        log.warning("Disconnected slow client %s: %s", self.ws.remote_address, reason)
+
+    def enqueue(self, message: str | bytes) -> bool:
+        """Queue *message* (str or TextFrame → text frame, other bytes →
+        binary) without blocking; it is dropped when the queue is full.
+
+        Returns:
+            False if the queue was full.
+        """
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            return False
+        return True
+
+    async def _write_loop(self) -> None:
+        try:
+            while True:
+                message = await self.queue.get()
+                if isinstance(message, TextFrame):
+                    await self.ws.send(message, text=True)
+                else:
+                    await self.ws.send(message)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+
+@dataclass(eq=False)
+class MgmtClient(Client):
+    user_id: str = ""
+    is_admin: bool = False
+
+
+@dataclass(eq=False)
+class Listener(Client):
+    """A listener browser connection. Disconnects only set ``dead``; the
+    per-language list is compacted lazily once enough entries are dead."""
+    dead: bool = False
+
+
+# Connected management UI WebSocket clients
+mgmt_clients: dict[ServerConnection, MgmtClient] = {}
+
+
+# target_lang → listener browsers, in connection order (may include dead entries)
+listener_clients: dict[str, list[Listener]] = {}
+
+# Compact a language's listener list once more than this fraction is dead
+LISTENER_COMPACT_RATIO = 0.25
+
+# HTTP routes, matched once per request; process_request() branches on
+# the outer group name. Bot ids and file names are limited to safe
+# characters (a file name can't start with ".", so ".." never reaches a
+# storage path), and malformed URLs 404 before any Supabase lookup.
+_BOT_ID = r"[A-Za-z0-9_-]+"
+_FILENAME = r"[A-Za-z0-9_-][A-Za-z0-9._-]*"
+_ROUTES = re.compile(
+    r"(?P<index>/(?:index\.html)?$)"
+    r"|(?P<listen>/listen)"
+    rf"|(?P<meeting>/meeting/(?P<meeting_bot>{_BOT_ID}))"
+    r"|(?P<health>/health$)"
+    rf"|(?P<api_meeting>/api/meeting/(?P<api_meeting_bot>{_BOT_ID}))"
+    r"|(?P<recordings>/api/recordings$)"
+    r"|(?P<admin_sessions>/api/admin/sessions$)"
+    r"|(?P<admin_dashboard>/api/admin/dashboard$)"
+    rf"|(?P<synced_audio>/api/recordings/(?P<audio_bot>{_BOT_ID})/audio$)"
+    rf"|(?P<dubbed_video>/api/recordings/(?P<video_bot>{_BOT_ID})/video$)"
+    rf"|(?P<download>/recordings/(?P<download_bot>{_BOT_ID})/(?P<download_file>{_FILENAME})$)"
+)
 
 # bot_ids currently building a synced MP3 or dubbed video (prevents duplicate builds)
 _synced_builds: set[str] = set()
 _video_builds: set[str] = set()
 
+# Sequence for clip ids in listener audio streams
+_clip_ids = itertools.count(1)
+
 # ── Cost rates ─────────────────────────────────────────────────────────
 # Recall.ai: $0.50/hr prorated to the second, billed per bot (not per participant)
 # Billed from joining_call → done (includes waiting room + post-call processing).
@@ -118,10 +343,10 @@ async def _generate_meeting_summary(session: BotSession) -> None:
     try:
         # Build readable transcript from JSONL
         lines = []
-        for line in session.transcript_buffer.strip().split("\n"):
+        for line in session.transcript_bytes.splitlines():
             if not line:
                 continue
-            entry = json.loads(line)
+            entry = orjson.loads(line)
             speaker = entry.get("speaker", "Unknown")
             text = entry.get("text", entry.get("original", ""))
             elapsed = entry.get("elapsed", 0)
@@ -158,7 +383,7 @@ async def _generate_meeting_summary(session: BotSession) -> None:
         # Store summary in DB and Storage
         await supabase_client.update_session_summary(session.bot_id, summary)
         await supabase_client.upload_text_file(
-            session.user_id, session.bot_id, "summary.md", summary
+            session.user_id, session.bot_id, "summary.md", summary.encode()
         )
         log.info("Generated summary for %s (%d input, %d output tokens)",
                  session.bot_id[:8], resp.usage.prompt_tokens, resp.usage.completion_tokens)
@@ -183,12 +408,47 @@ async def _extract_user_from_header(request: Request) -> dict | None:
     return None
 
 
+async def _user_email_map() -> dict[str, str]:
+    """user_id → email for all users; empty if the Admin API call fails."""
+    try:
+        all_users = await supabase_client.admin_list_users()
+    except Exception:
+        return {}
+    return {u["id"]: u["email"] for u in all_users}
+
+
 # ── Timeline-synced MP3 builder ────────────────────────────────────────
 
 async def _build_synced_mp3(owner_id: str, bot_id: str) -> bytes:
     """Download all clips, read transcript timing, and build a single
     timeline-synced MP3 using ffmpeg with silence gaps."""
 
+    # Clips are spooled to disk as they download, so memory stays at a batch
+    # of clips however long the meeting was
+    with tempfile.TemporaryDirectory() as clip_dir:
+        entries, clip_paths = await _download_synced_inputs(owner_id, bot_id, clip_dir)
+
+        # 5. Build the synced MP3 with ffmpeg in a temp directory
+        mp3_bytes = await asyncio.to_thread(
+            _ffmpeg_build_synced, entries, clip_paths
+        )
+    log.info("Synced MP3 built for %s: %.1f MB", bot_id[:8], len(mp3_bytes) / 1_000_000)
+    return mp3_bytes
+
+
+def _write_file(path: str, data: bytes) -> None:
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+async def _download_synced_inputs(
+    owner_id: str, bot_id: str, clip_dir: str
+) -> tuple[list[dict], dict[int, str]]:
+    """Fetch transcript entries and download every clip into *clip_dir*.
+
+    Returns the entries sorted by clip number and a map of clip number →
+    local file path (failed downloads are omitted).
+    """
     # Suppress httpx request logging during bulk downloads
     httpx_logger = logging.getLogger("httpx")
     prev_level = httpx_logger.level
@@ -203,13 +463,12 @@ async def _build_synced_mp3(owner_id: str, bot_id: str) -> bytes:
             raise ValueError("transcript.jsonl not found")
 
         # 2. Download transcript to get elapsed timestamps
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(transcript_url)
-            resp.raise_for_status()
+        resp = await supabase_client.download(transcript_url)
+        resp.raise_for_status()
         entries = []
         for line in resp.text.strip().split("\n"):
             if line.strip():
-                entries.append(json.loads(line))
+                entries.append(orjson.loads(line))
         entries.sort(key=lambda e: e["n"])
 
         if not entries:
@@ -218,65 +477,54 @@ async def _build_synced_mp3(owner_id: str, bot_id: str) -> bytes:
         clip_count = len(entries)
         log.info("Building synced MP3 for %s: %d clips", bot_id[:8], clip_count)
 
-        # 3. Get signed URLs for all clips (batched, low concurrency)
-        BATCH = 5
-        clip_urls = {}
-        for batch_start in range(1, clip_count + 1, BATCH):
-            batch_end = min(batch_start + BATCH, clip_count + 1)
-            tasks = {
-                i: supabase_client.get_signed_url(f"{owner_id}/{bot_id}/clip_{i:04d}.mp3")
-                for i in range(batch_start, batch_end)
-            }
-            results = await asyncio.gather(*tasks.values())
-            for i, url in zip(tasks.keys(), results):
-                if url:
-                    clip_urls[i] = url
-            await asyncio.sleep(0.1)  # back-pressure
+        # 3. Get signed URLs for all clips (bulk-signed)
+        clip_paths_by_num = {
+            i: f"{owner_id}/{bot_id}/clip_{i:04d}.mp3" for i in range(1, clip_count + 1)
+        }
+        signed = await supabase_client.get_signed_urls(list(clip_paths_by_num.values()))
+        clip_urls = {
+            i: signed[path] for i, path in clip_paths_by_num.items() if path in signed
+        }
 
         log.info("Signed URLs ready for %s: %d/%d", bot_id[:8], len(clip_urls), clip_count)
 
         # 4. Download all clips (batched with retry)
         DL_BATCH = 5
         MAX_RETRIES = 3
-        clip_data: dict[int, bytes] = {}
+        clip_paths: dict[int, str] = {}
         clip_nums = sorted(clip_urls.keys())
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            for batch_start in range(0, len(clip_nums), DL_BATCH):
-                batch = clip_nums[batch_start:batch_start + DL_BATCH]
-
-                async def _download(n: int) -> tuple[int, bytes | None]:
-                    for attempt in range(MAX_RETRIES):
-                        try:
-                            r = await client.get(clip_urls[n])
-                            r.raise_for_status()
-                            return n, r.content
-                        except Exception:
-                            if attempt < MAX_RETRIES - 1:
-                                await asyncio.sleep(1.0 * (attempt + 1))
-                            else:
-                                log.warning("Failed to download clip %d after %d retries", n, MAX_RETRIES)
-                    return n, None
-
-                results = await asyncio.gather(*[_download(n) for n in batch])
-                for n, data in results:
-                    if data is not None:
-                        clip_data[n] = data
-                await asyncio.sleep(0.1)  # back-pressure
-
-        log.info("Clips downloaded for %s: %d clips", bot_id[:8], len(clip_data))
+        async def _download(n: int) -> tuple[int, str | None]:
+            path = os.path.join(clip_dir, f"clip_{n:04d}.mp3")
+            for attempt in range(MAX_RETRIES):
+                try:
+                    r = await supabase_client.download(clip_urls[n])
+                    r.raise_for_status()
+                    await asyncio.to_thread(_write_file, path, r.content)
+                    return n, path
+                except Exception:
+                    if attempt < MAX_RETRIES - 1:
+                        await asyncio.sleep(1.0 * (attempt + 1))
+                    else:
+                        log.warning("Failed to download clip %d after %d retries", n, MAX_RETRIES)
+            return n, None
+
+        for batch_start in range(0, len(clip_nums), DL_BATCH):
+            batch = clip_nums[batch_start:batch_start + DL_BATCH]
+            results = await asyncio.gather(*[_download(n) for n in batch])
+            for n, path in results:
+                if path is not None:
+                    clip_paths[n] = path
+            await asyncio.sleep(0.1)  # back-pressure
+
+        log.info("Clips downloaded for %s: %d clips", bot_id[:8], len(clip_paths))
     finally:
         httpx_logger.setLevel(prev_level)
 
-    # 5. Build the synced MP3 with ffmpeg in a temp directory
-    mp3_bytes = await asyncio.to_thread(
-        _ffmpeg_build_synced, entries, clip_data
-    )
-    log.info("Synced MP3 built for %s: %.1f MB", bot_id[:8], len(mp3_bytes) / 1_000_000)
-    return mp3_bytes
+    return entries, clip_paths
 
 
-def _ffmpeg_build_synced(entries: list[dict], clip_data: dict[int, bytes]) -> bytes:
+def _ffmpeg_build_synced(entries: list[dict], clip_paths: dict[int, str]) -> bytes:
     """Place clips at their elapsed timestamps using a raw PCM buffer on disk.
 
     Creates a zeroed PCM file sized to the full timeline, decodes each MP3 clip
@@ -290,34 +538,30 @@ def _ffmpeg_build_synced(entries: list[dict], clip_data: dict[int, bytes]) -> by
         # 1. Calculate total duration from max (elapsed + clip_duration)
         max_end = 0.0
         for entry in entries:
-            if entry["n"] not in clip_data:
+            if entry["n"] not in clip_paths:
                 continue
             clip_dur = entry.get("audio_end", 0) - entry.get("audio_start", 0)
             max_end = max(max_end, entry["elapsed"] + max(clip_dur, 0.5))
 
         total_bytes = int((max_end + 1.0) * SAMPLE_RATE) * BYTES_PER_SAMPLE
 
-        # 2. Create zeroed PCM file on disk (write in 1MB chunks)
+        # 2. Create zeroed PCM file on disk. Extending with truncate() reads
+        # back as zeros without writing them (sparse where supported).
         pcm_path = os.path.join(tmpdir, "timeline.pcm")
         with open(pcm_path, "wb") as f:
-            chunk = b'\x00' * (1024 * 1024)
-            remaining = total_bytes
-            while remaining > 0:
-                write_size = min(remaining, len(chunk))
-                f.write(chunk[:write_size])
-                remaining -= write_size
+            f.truncate(total_bytes)
 
         # 3. Decode each clip to raw PCM and write at correct byte offset
         with open(pcm_path, "r+b") as pcm_file:
             for entry in entries:
                 n = entry["n"]
-                if n not in clip_data:
+                if n not in clip_paths:
                     continue
 
                 proc = subprocess.run(
-                    ["ffmpeg", "-i", "pipe:0", "-f", "s16le",
+                    ["ffmpeg", "-i", clip_paths[n], "-f", "s16le",
                      "-ar", str(SAMPLE_RATE), "-ac", "1", "pipe:1"],
-                    input=clip_data[n], capture_output=True,
+                    capture_output=True,
                 )
                 if proc.returncode != 0:
                     continue
@@ -347,14 +591,13 @@ async def _build_synced_srt(owner_id: str, bot_id: str) -> str:
     if not transcript_url:
         raise ValueError("transcript.jsonl not found")
 
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(transcript_url)
-        resp.raise_for_status()
+    resp = await supabase_client.download(transcript_url)
+    resp.raise_for_status()
 
     entries = []
     for line in resp.text.strip().split("\n"):
         if line.strip():
-            entries.append(json.loads(line))
+            entries.append(orjson.loads(line))
     entries.sort(key=lambda e: e["n"])
 
     srt = ""
@@ -364,7 +607,7 @@ async def _build_synced_srt(owner_id: str, bot_id: str) -> str:
         clip_dur = entry.get("audio_end", 0) - entry.get("audio_start", 0)
         end = start + max(clip_dur, 0.5)
         srt += f"{n}\n"
-        srt += f"{_format_srt_time(start)} --> {_format_srt_time(end)}\n"
+        srt += f"{_format_srt_range(start, end)}\n"
         srt += f"{entry.get('translated', '')}\n\n"
 
     return srt
@@ -495,6 +738,106 @@ async def _build_dubbed_video(owner_id: str, bot_id: str) -> None:
 
 # ── HTTP request handler (serves web UI) ──────────────────────────────
 
+def _with_supabase_config(page: str) -> str:
+    page = page.replace("__SUPABASE_URL__", config.SUPABASE_URL)
+    return page.replace("__SUPABASE_ANON_KEY__", config.SUPABASE_ANON_KEY)
+
+
+@dataclass(frozen=True)
+class _StaticPage:
+    """A page that only changes on deploy: encoded, gzipped and hashed once."""
+    body: bytes
+    body_gz: bytes
+    etag: str  # of the identity body; the gzip variant appends "-gz"
+
+    @classmethod
+    def build(cls, html: str) -> _StaticPage:
+        body = html.encode()
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        return cls(body, gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}"')
+
+
+# Browsers reuse a page for STATIC_PAGE_MAX_AGE, then revalidate with
+# If-None-Match (a 304 unless a deploy changed it)
+STATIC_PAGE_MAX_AGE = 300
+_STATIC_CACHE_CONTROL = f"public, max-age={STATIC_PAGE_MAX_AGE}, stale-while-revalidate=86400"
+
+_INDEX_PAGE = _StaticPage.build(_with_supabase_config(HTML_PAGE))
+_LISTEN_PAGE = _StaticPage.build(LISTEN_PAGE)
+_MEETING_TEMPLATE = _with_supabase_config(MEETING_PAGE)
+
+
+def _accepts_gzip(request: Request) -> bool:
+    """True if the Accept-Encoding header allows gzip (q > 0)."""
+    for coding in request.headers.get("Accept-Encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() not in ("gzip", "*"):
+            continue
+        q = params.strip()
+        if not q.startswith("q="):
+            return True
+        try:
+            return float(q[2:]) > 0
+        except ValueError:
+            return False
+    return False
+
+
+def _bytes_response(
+    status: int, body: bytes, content_type: str, extra_headers: tuple[tuple[str, str], ...] = (),
+) -> Response:
+    # connection.respond() only takes str; build the Response directly so
+    # already-encoded bodies aren't decoded and re-encoded
+    headers = Headers([
+        ("Date", email.utils.formatdate(usegmt=True)),
+        ("Connection", "close"),
+        ("Content-Length", str(len(body))),
+        ("Content-Type", content_type),
+        *extra_headers,
+    ])
+    return Response(status, HTTPStatus(status).phrase, headers, body)
+
+
+def _html_response(body: bytes) -> Response:
+    """Build a 200 HTML response for an already-encoded page."""
+    return _bytes_response(200, body, "text/html; charset=utf-8")
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("If-None-Match", "")
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _static_page_response(request: Request, page: _StaticPage) -> Response:
+    """Serve a static page, precompressed if the client accepts gzip, or a
+    bodiless 304 if the client's cached copy is current."""
+    gz = _accepts_gzip(request)
+    etag = page.etag[:-1] + '-gz"' if gz else page.etag
+    cache_headers = (
+        ("Vary", "Accept-Encoding"),
+        ("ETag", etag),
+        ("Cache-Control", _STATIC_CACHE_CONTROL),
+    )
+    if _etag_matches(request, etag):
+        headers = Headers([
+            ("Date", email.utils.formatdate(usegmt=True)),
+            ("Connection", "close"),
+            *cache_headers,
+        ])
+        return Response(304, HTTPStatus.NOT_MODIFIED.phrase, headers, b"")
+    if gz:
+        return _bytes_response(200, page.body_gz, "text/html; charset=utf-8",
+                               (("Content-Encoding", "gzip"), *cache_headers))
+    return _bytes_response(200, page.body, "text/html; charset=utf-8", cache_headers)
+
+
+def _json_response(obj: Any, status: int = 200) -> Response:
+    """Build a JSON API response, serialized straight to bytes with orjson."""
+    return _bytes_response(status, orjson.dumps(obj), "application/json")
+
+
 async def process_request(connection: ServerConnection, request: Request) -> Response | None:
     """Intercept HTTP requests to serve the web UI page.
 
@@ -505,85 +848,71 @@ async def process_request(connection: ServerConnection, request: Request) -> Res
     if request.headers.get("Upgrade", "").lower() == "websocket":
         return None
 
-    if request.path == "/" or request.path == "/index.html":
-        page = HTML_PAGE.replace("__SUPABASE_URL__", config.SUPABASE_URL)
-        page = page.replace("__SUPABASE_ANON_KEY__", config.SUPABASE_ANON_KEY)
-        response = connection.respond(200, page)
-        response.headers["Content-Type"] = "text/html; charset=utf-8"
-        return response
+    match = _ROUTES.match(request.path)
+    route = match.lastgroup if match else None
 
-    if request.path.startswith("/listen"):
-        response = connection.respond(200, LISTEN_PAGE)
-        response.headers["Content-Type"] = "text/html; charset=utf-8"
-        return response
+    if route == "index":
+        return _static_page_response(request, _INDEX_PAGE)
+
+    if route == "listen":
+        return _static_page_response(request, _LISTEN_PAGE)
 
     # Meeting review page: /meeting/<bot_id>
-    if request.path.startswith("/meeting/"):
-        parts = request.path.strip("/").split("/")
-        if len(parts) >= 2:
-            bot_id = parts[1]
-            page = MEETING_PAGE.replace("__SUPABASE_URL__", config.SUPABASE_URL)
-            page = page.replace("__SUPABASE_ANON_KEY__", config.SUPABASE_ANON_KEY)
-            page = page.replace("__BOT_ID__", bot_id)
-            response = connection.respond(200, page)
-            response.headers["Content-Type"] = "text/html; charset=utf-8"
-            return response
+    if route == "meeting":
+        bot_id = match["meeting_bot"]
+        return _html_response(_MEETING_TEMPLATE.replace("__BOT_ID__", bot_id).encode())
 
-    if request.path == "/health":
+    if route == "health":
         response = connection.respond(200, "ok")
         return response
 
     # API: meeting data for review page
-    if request.path.startswith("/api/meeting/"):
-        parts = request.path.strip("/").split("/")
-        if len(parts) >= 3:
-            bot_id = parts[2]
-            user = await _extract_user_from_header(request)
-            if not user:
-                return connection.respond(401, "Unauthorized")
-            session_data = await supabase_client.get_session(bot_id)
-            if not session_data:
-                return connection.respond(404, "Session not found")
-            # Verify ownership or admin
-            if session_data.get("user_id") != user["sub"] and not _is_admin(user):
-                return connection.respond(403, "Forbidden")
-            # Load transcript from storage
-            transcript_lines = []
-            try:
-                owner_id = session_data.get("user_id", "")
-                signed_url = await supabase_client.get_signed_url(
-                    f"{owner_id}/{bot_id}/transcript.jsonl"
-                )
-                if signed_url:
-                    async with httpx.AsyncClient(timeout=15) as client:
-                        resp = await client.get(signed_url)
-                        if resp.status_code == 200:
-                            for line in resp.text.strip().split("\n"):
-                                if line:
-                                    transcript_lines.append(json.loads(line))
-            except Exception:
-                log.exception("Failed to load transcript for %s", bot_id)
-            result = {
-                "bot_id": bot_id,
-                "summary": session_data.get("summary", ""),
-                "transcript": transcript_lines,
-                "source_lang": session_data.get("source_lang", ""),
-                "mode": session_data.get("mode", "translate"),
-                "duration": session_data.get("duration"),
-                "created_at": session_data.get("created_at", ""),
-            }
-            body = json.dumps(result)
-            response = connection.respond(200, body)
-            response.headers["Content-Type"] = "application/json"
-            return response
+    if route == "api_meeting":
+        bot_id = match["api_meeting_bot"]
+        user = await _extract_user_from_header(request)
+        if not user:
+            return connection.respond(401, "Unauthorized")
+        session_data = await supabase_client.get_session(bot_id)
+        if not session_data:
+            return connection.respond(404, "Session not found")
+        # Verify ownership or admin
+        if session_data.get("user_id") != user["sub"] and not _is_admin(user):
+            return connection.respond(403, "Forbidden")
+        # Load transcript from storage
+        transcript_lines = []
+        try:
+            owner_id = session_data.get("user_id", "")
+            signed_url = await supabase_client.get_signed_url(
+                f"{owner_id}/{bot_id}/transcript.jsonl"
+            )
+            if signed_url:
+                resp = await supabase_client.download(signed_url, timeout=15)
+                if resp.status_code == 200:
+                    for line in resp.text.strip().split("\n"):
+                        if line:
+                            transcript_lines.append(orjson.loads(line))
+        except Exception:
+            log.exception("Failed to load transcript for %s", bot_id)
+        result = {
+            "bot_id": bot_id,
+            "summary": session_data.get("summary", ""),
+            "transcript": transcript_lines,
+            "source_lang": session_data.get("source_lang", ""),
+            "mode": session_data.get("mode", "translate"),
+            "duration": session_data.get("duration"),
+            "created_at": session_data.get("created_at", ""),
+        }
+        return _json_response(result)
 
     # API: list user's recordings from Supabase
-    if request.path == "/api/recordings":
+    if route == "recordings":
         user = await _extract_user_from_header(request)
         if not user:
             return connection.respond(401, "Unauthorized")
         user_id = user["sub"]
-        sessions = await supabase_client.get_user_sessions(user_id)
+        sessions = await supabase_client.get_user_sessions(
+            user_id, "bot_id,clip_count,duration,status,api_cost,mode,summary",
+        )
         recordings = []
         for s in sessions:
             mode = s.get("mode", "translate")
@@ -598,22 +927,20 @@ async def process_request(connection: ServerConnection, request: Request) -> Res
                     "mode": mode,
                     "summary": bool(s.get("summary")),
                 })
-        body = json.dumps(recordings)
-        response = connection.respond(200, body)
-        response.headers["Content-Type"] = "application/json"
-        return response
+        return _json_response(recordings)
 
     # API: admin — list all sessions across all users
-    if request.path == "/api/admin/sessions":
+    if route == "admin_sessions":
         user = await _extract_user_from_header(request)
         if not user or not _is_admin(user):
             return connection.respond(403, "Forbidden")
-        sessions = await supabase_client.get_all_sessions()
-        try:
-            all_users = await supabase_client.admin_list_users()
-            email_map = {u["id"]: u["email"] for u in all_users}
-        except Exception:
-            email_map = {}
+        # Independent reads; fetch sessions and the user list concurrently
+        sessions, email_map = await asyncio.gather(
+            supabase_client.get_all_sessions(
+                "bot_id,user_id,clip_count,duration,status,source_lang,target_lang,mode,created_at,api_cost",
+            ),
+            _user_email_map(),
+        )
         recordings = []
         for s in sessions:
             mode = s.get("mode", "translate")
@@ -632,17 +959,17 @@ async def process_request(connection: ServerConnection, request: Request) -> Res
                     "created_at": s.get("created_at", ""),
                     "api_cost": s.get("api_cost"),
                 })
-        body = json.dumps(recordings)
-        response = connection.respond(200, body)
-        response.headers["Content-Type"] = "application/json"
-        return response
+        return _json_response(recordings)
 
     # API: admin dashboard — aggregated cost/revenue summary
-    if request.path == "/api/admin/dashboard":
+    if route == "admin_dashboard":
         user = await _extract_user_from_header(request)
         if not user or not _is_admin(user):
             return connection.respond(403, "Forbidden")
-        sessions = await supabase_client.get_all_sessions()
+        sessions, email_map = await asyncio.gather(
+            supabase_client.get_all_sessions("user_id,clip_count,duration,api_cost"),
+            _user_email_map(),
+        )
         total_duration = 0.0
         total_api_cost = 0.0
         total_sessions = 0
@@ -662,12 +989,6 @@ async def process_request(connection: ServerConnection, request: Request) -> Res
                 per_user[uid]["clips"] += clips
                 per_user[uid]["minutes"] += (s.get("duration") or 0) / 60.0
                 per_user[uid]["api_cost"] += s.get("api_cost") or 0
-        # Build user_id -> email lookup
-        try:
-            all_users = await supabase_client.admin_list_users()
-            email_map = {u["id"]: u["email"] for u in all_users}
-        except Exception:
-            email_map = {}
         # Round per-user values and compute revenue/margin
         users_list = []
         for uid, u in per_user.items():
@@ -754,123 +1075,100 @@ async def process_request(connection: ServerConnection, request: Request) -> Res
         except Exception:
             log.exception("Failed to fetch DeepL usage")
 
-        body = json.dumps(dashboard)
-        response = connection.respond(200, body)
-        response.headers["Content-Type"] = "application/json"
-        return response
+        return _json_response(dashboard)
 
     # API: timeline-synced MP3 — check/build/redirect
-    if request.path.startswith("/api/recordings/") and request.path.endswith("/audio"):
+    if route == "synced_audio":
         user = await _extract_user_from_header(request)
         if not user:
             return connection.respond(401, "Unauthorized")
         user_id = user["sub"]
         admin = _is_admin(user)
-        parts = request.path.strip("/").split("/")
-        if len(parts) == 4:
-            bot_id = parts[2]
-            session = await supabase_client.get_session_by_bot_id(bot_id)
-            if not session or (not admin and session.get("user_id") != user_id):
-                return connection.respond(403, "Forbidden")
-            owner_id = session.get("user_id", user_id)
-            # If a build is already in progress → return 202 (skip storage check)
-            if bot_id in _synced_builds:
-                body = json.dumps({"status": "building"})
-                response = connection.respond(202, body)
-                response.headers["Content-Type"] = "application/json"
-                return response
-
-            synced_path = f"{owner_id}/{bot_id}/synced.mp3"
-
-            # If synced.mp3 already exists → redirect immediately
-            signed_url = await supabase_client.get_signed_url(synced_path)
-            if signed_url:
-                response = connection.respond(302, "")
-                response.headers["Location"] = signed_url
-                return response
-
-            # Start background build
-            _synced_builds.add(bot_id)
-            asyncio.create_task(_background_build_synced(owner_id, bot_id))
-            body = json.dumps({"status": "building"})
-            response = connection.respond(202, body)
-            response.headers["Content-Type"] = "application/json"
+        bot_id = match["audio_bot"]
+        session = await supabase_client.get_session_by_bot_id(bot_id, "user_id")
+        if not session or (not admin and session.get("user_id") != user_id):
+            return connection.respond(403, "Forbidden")
+        owner_id = session.get("user_id", user_id)
+        # If a build is already in progress → return 202 (skip storage check)
+        if bot_id in _synced_builds:
+            return _json_response({"status": "building"}, 202)
+
+        synced_path = f"{owner_id}/{bot_id}/synced.mp3"
+
+        # If synced.mp3 already exists → redirect immediately
+        signed_url = await supabase_client.get_signed_url(synced_path)
+        if signed_url:
+            response = connection.respond(302, "")
+            response.headers["Location"] = signed_url
             return response
-        return connection.respond(404, "Not Found")
+
+        # Start background build
+        _synced_builds.add(bot_id)
+        asyncio.create_task(_background_build_synced(owner_id, bot_id))
+        return _json_response({"status": "building"}, 202)
 
     # API: dubbed video — check/build/redirect
-    if request.path.startswith("/api/recordings/") and request.path.endswith("/video"):
+    if route == "dubbed_video":
         user = await _extract_user_from_header(request)
         if not user:
             return connection.respond(401, "Unauthorized")
         user_id = user["sub"]
         admin = _is_admin(user)
-        parts = request.path.strip("/").split("/")
-        if len(parts) == 4:
-            bot_id = parts[2]
-            session = await supabase_client.get_session_by_bot_id(bot_id)
-            if not session or (not admin and session.get("user_id") != user_id):
-                return connection.respond(403, "Forbidden")
-            owner_id = session.get("user_id", user_id)
-            # If a build is already in progress → return 202
-            if bot_id in _video_builds:
-                body = json.dumps({"status": "building"})
-                response = connection.respond(202, body)
-                response.headers["Content-Type"] = "application/json"
-                return response
-
-            dubbed_path = f"{owner_id}/{bot_id}/dubbed.mp4"
-
-            # If dubbed.mp4 already exists → redirect immediately
-            signed_url = await supabase_client.get_signed_url(dubbed_path)
-            if signed_url:
-                response = connection.respond(302, "")
-                response.headers["Location"] = signed_url
-                return response
-
-            # Start background build
-            _video_builds.add(bot_id)
-            asyncio.create_task(_build_dubbed_video(owner_id, bot_id))
-            body = json.dumps({"status": "building"})
-            response = connection.respond(202, body)
-            response.headers["Content-Type"] = "application/json"
+        bot_id = match["video_bot"]
+        session = await supabase_client.get_session_by_bot_id(bot_id, "user_id")
+        if not session or (not admin and session.get("user_id") != user_id):
+            return connection.respond(403, "Forbidden")
+        owner_id = session.get("user_id", user_id)
+        # If a build is already in progress → return 202
+        if bot_id in _video_builds:
+            return _json_response({"status": "building"}, 202)
+
+        dubbed_path = f"{owner_id}/{bot_id}/dubbed.mp4"
+
+        # If dubbed.mp4 already exists → redirect immediately
+        signed_url = await supabase_client.get_signed_url(dubbed_path)
+        if signed_url:
+            response = connection.respond(302, "")
+            response.headers["Location"] = signed_url
             return response
-        return connection.respond(404, "Not Found")
+
+        # Start background build
+        _video_builds.add(bot_id)
+        asyncio.create_task(_build_dubbed_video(owner_id, bot_id))
+        return _json_response({"status": "building"}, 202)
 
     # Download recordings: /recordings/<bot_id>/<filename>
-    if request.path.startswith("/recordings/"):
+    if route == "download":
         user = await _extract_user_from_header(request)
         if not user:
             return connection.respond(401, "Unauthorized")
         user_id = user["sub"]
         admin = _is_admin(user)
-        parts = request.path.strip("/").split("/")
-        if len(parts) == 3:
-            bot_id, filename = parts[1], parts[2]
-            session = await supabase_client.get_session_by_bot_id(bot_id)
-            if not session or (not admin and session.get("user_id") != user_id):
-                return connection.respond(403, "Forbidden")
-            owner_id = session.get("user_id", user_id)
-
-            # Generate synced SRT from transcript.jsonl elapsed timestamps
-            if filename == "subtitles.srt":
-                try:
-                    srt_text = await _build_synced_srt(owner_id, bot_id)
-                except Exception:
-                    log.exception("Failed to build synced SRT for %s", bot_id)
-                    return connection.respond(500, "Failed to generate subtitles")
-                response = connection.respond(200, srt_text)
-                response.headers["Content-Type"] = "text/plain; charset=utf-8"
-                response.headers["Content-Disposition"] = f'attachment; filename="{bot_id[:8]}_subtitles.srt"'
-                return response
-
-            # Other files (transcript.jsonl, etc.) → redirect to signed URL
-            path = f"{owner_id}/{bot_id}/{filename}"
-            signed_url = await supabase_client.get_signed_url(path)
-            if signed_url:
-                response = connection.respond(302, "")
-                response.headers["Location"] = signed_url
-                return response
+        bot_id, filename = match["download_bot"], match["download_file"]
+        session = await supabase_client.get_session_by_bot_id(bot_id, "user_id")
+        if not session or (not admin and session.get("user_id") != user_id):
+            return connection.respond(403, "Forbidden")
+        owner_id = session.get("user_id", user_id)
+
+        # Generate synced SRT from transcript.jsonl elapsed timestamps
+        if filename == "subtitles.srt":
+            try:
+                srt_text = await _build_synced_srt(owner_id, bot_id)
+            except Exception:
+                log.exception("Failed to build synced SRT for %s", bot_id)
+                return connection.respond(500, "Failed to generate subtitles")
+            response = connection.respond(200, srt_text)
+            response.headers["Content-Type"] = "text/plain; charset=utf-8"
+            response.headers["Content-Disposition"] = f'attachment; filename="{bot_id[:8]}_subtitles.srt"'
+            return response
+
+        # Other files (transcript.jsonl, etc.) → redirect to signed URL
+        path = f"{owner_id}/{bot_id}/{filename}"
+        signed_url = await supabase_client.get_signed_url(path)
+        if signed_url:
+            response = connection.respond(302, "")
+            response.headers["Location"] = signed_url
+            return response
         return connection.respond(404, "Not Found")
 
     # Unknown non-WebSocket request
@@ -882,9 +1180,8 @@ async def process_request(connection: ServerConnection, request: Request) -> Res
 def _sessions_snapshot(user_id: str, admin: bool = False) -> list[dict]:
     """Return bot sessions belonging to a specific user (or all if admin)."""
     result = []
-    for s in bot_sessions.values():
-        if not admin and s.user_id != user_id:
-            continue
+    sessions = bot_sessions if admin else _sessions_by_user.get(user_id, {})
+    for s in sessions.values():
         entry = {
             "bot_id": s.bot_id,
             "meeting_url": s.meeting_url,
@@ -900,18 +1197,69 @@ def _sessions_snapshot(user_id: str, admin: bool = False) -> list[dict]:
     return result
 
 
+# Encoded status messages per viewer (all admins share one; each user gets
+# their own), rebuilt only after _mark_status_dirty(). Call that whenever
+# bot_sessions or a field shown by _sessions_snapshot() changes.
+_status_cache: dict[tuple[bool, str], TextFrame] = {}
+
+
+def _mark_status_dirty() -> None:
+    _status_cache.clear()
+
+
+def _status_message(user_id: str, admin: bool) -> TextFrame:
+    key = (True, "") if admin else (False, user_id)
+    message = _status_cache.get(key)
+    if message is None:
+        snapshot = _sessions_snapshot(user_id, admin=admin)
+        message = _status_cache[key] = TextFrame(orjson.dumps({"type": "status", "bots": snapshot}))
+    return message
+
+
+# Set by broadcast_status(); _status_coalescer() sends one status per burst
+_status_pending = asyncio.Event()
+STATUS_DEBOUNCE = 0.05  # seconds
+
+
 async def broadcast_status() -> None:
-    """Send current bot status to all connected management clients, filtered by user."""
-    stale = set()
-    for ws, info in mgmt_clients.items():
-        try:
-            snapshot = _sessions_snapshot(info["user_id"], admin=info["is_admin"])
-            msg = json.dumps({"type": "status", "bots": snapshot})
-            await ws.send(msg)
-        except Exception:
-            stale.add(ws)
-    for ws in stale:
-        mgmt_clients.pop(ws, None)
+    """Schedule a status update for all management clients.
+
+    Calls within STATUS_DEBOUNCE of each other (e.g. starting one bot per
+    target language) collapse into a single message per client.
+    """
+    _status_pending.set()
+
+
+async def _status_coalescer() -> None:
+    """Background task: send current bot status to all connected management
+    clients, filtered by user, once per burst of broadcast_status() calls."""
+    while True:
+        await _status_pending.wait()
+        await asyncio.sleep(STATUS_DEBOUNCE)
+        _status_pending.clear()
+        for client in mgmt_clients.values():
+            # A dropped status would leave the UI stale until the next change,
+            # so a client this far behind is reconnected for a fresh snapshot
+            if not client.enqueue(_status_message(client.user_id, client.is_admin)):
+                client.disconnect("Management client too slow")
+
+
+_RECORDINGS_CHANGED = TextFrame(orjson.dumps({"type": "recordings_changed"}))
+
+
+def _notify_recordings_changed(user_id: str) -> None:
+    """Tell the owner's and admins' management UIs to reload their
+    recordings lists (they no longer poll /api/recordings)."""
+    for client in mgmt_clients.values():
+        if client.is_admin or client.user_id == user_id:
+            # A dropped hint only delays the refresh until the next one
+            client.enqueue(_RECORDINGS_CHANGED)
+
+
+async def _store_final_status(session: BotSession, **fields: Any) -> None:
+    """Write a finished session's "stopped" row, then announce the new recording."""
+    await supabase_client.update_session_status(session.bot_id, "stopped", **fields)
+    _notify_recordings_changed(session.user_id)
 
 
 # ── Management WebSocket handler (/mgmt) ──────────────────────────────
@@ -920,19 +1268,21 @@ async def mgmt_handler(ws: ServerConnection, user: dict) -> None:
     """Handle management WebSocket connections from the web UI."""
     user_id = user["sub"]
     admin = _is_admin(user)
-    mgmt_clients[ws] = {"user_id": user_id, "is_admin": admin}
+    client = MgmtClient(ws, user_id=user_id, is_admin=admin)
+    client.start()
+    mgmt_clients[ws] = client
     log.info("Management client connected (user=%s, admin=%s)", user_id[:8], admin)
 
     # Send current state immediately (include admin flag so UI can adapt)
     snapshot = _sessions_snapshot(user_id, admin=admin)
-    await ws.send(json.dumps({"type": "status", "bots": snapshot, "is_admin": admin}))
+    await ws.send(orjson.dumps({"type": "status", "bots": snapshot, "is_admin": admin}), text=True)
 
     try:
         async for raw_msg in ws:
             try:
-                msg = json.loads(raw_msg)
-            except (json.JSONDecodeError, TypeError):
-                await ws.send(json.dumps({"type": "error", "message": "Invalid JSON"}))
+                msg = orjson.loads(raw_msg)
+            except (orjson.JSONDecodeError, TypeError):
+                await ws.send(orjson.dumps({"type": "error", "message": "Invalid JSON"}), text=True)
                 continue
 
             action = msg.get("action")
@@ -950,12 +1300,13 @@ async def mgmt_handler(ws: ServerConnection, user: dict) -> None:
             elif action == "ask":
                 await _handle_ask(ws, msg, user_id, admin)
             else:
-                await ws.send(json.dumps({"type": "error", "message": f"Unknown action: {action}"}))
+                await ws.send(orjson.dumps({"type": "error", "message": f"Unknown action: {action}"}), text=True)
 
     except websockets.exceptions.ConnectionClosed:
         pass
     finally:
         mgmt_clients.pop(ws, None)
+        client.stop()
         log.info("Management client disconnected (user=%s)", user_id[:8])
 
 
@@ -964,7 +1315,7 @@ async def _handle_start(ws: ServerConnection, msg: dict, user_id: str) -> None:
     mode = msg.get("mode", "translate")
 
     if not meeting_url:
-        await ws.send(json.dumps({"type": "error", "message": "Missing meeting_url"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Missing meeting_url"}), text=True)
         return
 
     if mode == "notes":
@@ -982,7 +1333,7 @@ async def _handle_start(ws: ServerConnection, msg: dict, user_id: str) -> None:
                 mode="notes",
                 status="in_call",
             )
-            bot_sessions[bot_id] = session
+            _add_session(session)
             _init_recording(session)
             asyncio.create_task(supabase_client.create_session(
                 user_id=user_id, bot_id=bot_id, meeting_url=meeting_url,
@@ -991,16 +1342,18 @@ async def _handle_start(ws: ServerConnection, msg: dict, user_id: str) -> None:
             log.info("Started notes bot %s (user=%s)", bot_id, user_id[:8])
         except Exception as e:
             log.exception("Failed to create notes bot")
-            await ws.send(json.dumps({"type": "error", "message": f"Failed to start notes bot: {e}"}))
+            await ws.send(orjson.dumps({"type": "error", "message": f"Failed to start notes bot: {e}"}), text=True)
     else:
         # Translation mode (or "both" = translate + notes)
         source_lang = msg.get("source_lang", "en")
         target_langs = msg.get("target_langs", [])
         if not target_langs:
-            await ws.send(json.dumps({"type": "error", "message": "Select at least one target language"}))
+            await ws.send(orjson.dumps({"type": "error", "message": "Select at least one target language"}), text=True)
             return
 
-        for target_lang in target_langs:
+        # Create the bots concurrently so startup waits on one Recall.ai round
+        # trip rather than one per language. Each task reports its own failure.
+        async def _start_one(target_lang: str) -> None:
             lang_upper = target_lang.upper()
             bot_name = f"Translator ({lang_upper})"
             try:
@@ -1014,7 +1367,7 @@ async def _handle_start(ws: ServerConnection, msg: dict, user_id: str) -> None:
                     mode=mode,  # "translate" or "both"
                     status="in_call",
                 )
-                bot_sessions[bot_id] = session
+                _add_session(session)
                 _init_recording(session)
                 asyncio.create_task(supabase_client.create_session(
                     user_id=user_id, bot_id=bot_id, meeting_url=meeting_url,
@@ -1023,7 +1376,14 @@ async def _handle_start(ws: ServerConnection, msg: dict, user_id: str) -> None:
                 log.info("Started bot %s for %s → %s mode=%s (user=%s)", bot_id, source_lang, target_lang, mode, user_id[:8])
             except Exception as e:
                 log.exception("Failed to create bot for %s", target_lang)
-                await ws.send(json.dumps({"type": "error", "message": f"Failed to create bot for {lang_upper}: {e}"}))
+                try:
+                    await ws.send(orjson.dumps({"type": "error", "message": f"Failed to create bot for {lang_upper}: {e}"}), text=True)
+                except websockets.exceptions.ConnectionClosed:
+                    pass
+
+        # gather, not a TaskGroup: one task failing must never cancel a
+        # sibling mid-create_bot, leaving a billed bot that's never registered
+        await asyncio.gather(*(_start_one(lang) for lang in target_langs), return_exceptions=True)
 
     await broadcast_status()
 
@@ -1032,12 +1392,12 @@ async def _handle_stop(ws: ServerConnection, msg: dict, user_id: str, admin: boo
     bot_id = msg.get("bot_id", "").strip()
     session = bot_sessions.get(bot_id)
     if not session:
-        await ws.send(json.dumps({"type": "error", "message": f"Unknown bot: {bot_id}"}))
+        await ws.send(orjson.dumps({"type": "error", "message": f"Unknown bot: {bot_id}"}), text=True)
         return
 
     # Verify ownership (admins can stop any bot)
     if not admin and session.user_id != user_id:
-        await ws.send(json.dumps({"type": "error", "message": "Not authorized to stop this bot"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Not authorized to stop this bot"}), text=True)
         return
 
     try:
@@ -1046,26 +1406,25 @@ async def _handle_stop(ws: ServerConnection, msg: dict, user_id: str, admin: boo
         log.exception("Error stopping bot %s", bot_id)
 
     # Clean up ASR streams
-    for pid in list(session.asr_streams):
-        stream = session.asr_streams.pop(pid, None)
-        if stream:
-            await stream.close()
+    await close_asr(session)
 
     session.status = "stopped"
+    _mark_status_dirty()
     await broadcast_status()
+    await _finish_clips(session)
 
     # Upload transcript to Supabase Storage
-    if session.transcript_buffer:
+    if session.has_transcript:
         asyncio.create_task(supabase_client.upload_text_file(
-            session.user_id, bot_id, "transcript.jsonl", session.transcript_buffer
+            session.user_id, bot_id, "transcript.jsonl", session.transcript_bytes
         ))
 
     # Generate summary for notes/both modes before calculating costs (adds Sonnet tokens)
-    if session.mode in ("notes", "both") and session.transcript_buffer:
+    if session.mode in ("notes", "both") and session.has_transcript:
         await _generate_meeting_summary(session)
 
     # Calculate API costs
-    meeting_minutes = (time.time() - session.recording_start) / 60.0 if session.recording_start else 0
+    meeting_minutes = (_session_clock() - session.recording_start) / 60.0 if session.recording_start else 0
     costs = _calculate_costs(session, meeting_minutes)
     log.info(
         "Session costs for %s: Recall=$%.2f, Deepgram=$%.2f (%d min × %d streams), "
@@ -1079,73 +1438,73 @@ async def _handle_stop(ws: ServerConnection, msg: dict, user_id: str, admin: boo
     )
 
     # Upload final SRT (translate mode only)
-    if session.srt_buffer:
+    if session.has_subtitles:
         asyncio.create_task(supabase_client.upload_text_file(
-            session.user_id, bot_id, "subtitles.srt", session.srt_buffer
+            session.user_id, bot_id, "subtitles.srt", session.srt_bytes
         ))
 
     # For notes/both mode, use wall-clock duration; for translate-only, use audio offset
     duration = meeting_minutes * 60 if session.mode in ("notes", "both") else session.audio_offset
 
     # Update DB status (including cost breakdown)
-    asyncio.create_task(supabase_client.update_session_status(
-        bot_id, "stopped", clip_count=session.clip_count, duration=round(duration, 1),
+    asyncio.create_task(_store_final_status(
+        session, clip_count=session.clip_count, duration=round(duration, 1),
         api_cost=round(costs["total"], 4),
     ))
 
     # Remove from active sessions after broadcasting the stopped status
-    bot_sessions.pop(bot_id, None)
+    _remove_session(bot_id)
 
 
 async def _handle_list_users(ws: ServerConnection, admin: bool) -> None:
     if not admin:
-        await ws.send(json.dumps({"type": "error", "message": "Admin only"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Admin only"}), text=True)
         return
     try:
         users = await supabase_client.admin_list_users()
-        await ws.send(json.dumps({"type": "users", "users": users}))
+        await ws.send(orjson.dumps({"type": "users", "users": users}), text=True)
     except Exception as e:
         log.exception("Failed to list users")
-        await ws.send(json.dumps({"type": "error", "message": f"Failed to list users: {e}"}))
+        await ws.send(orjson.dumps({"type": "error", "message": f"Failed to list users: {e}"}), text=True)
 
 
 async def _handle_create_user(ws: ServerConnection, msg: dict, admin: bool) -> None:
     if not admin:
-        await ws.send(json.dumps({"type": "error", "message": "Admin only"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Admin only"}), text=True)
         return
     email = (msg.get("email") or "").strip()
     password = msg.get("password") or ""
     if not email or not password:
-        await ws.send(json.dumps({"type": "error", "message": "Email and password required"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Email and password required"}), text=True)
         return
     if len(password) < 6:
-        await ws.send(json.dumps({"type": "error", "message": "Password must be at least 6 characters"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Password must be at least 6 characters"}), text=True)
         return
     try:
         user = await supabase_client.admin_create_user(email, password)
-        await ws.send(json.dumps({"type": "user_created", "user": user}))
+        await ws.send(orjson.dumps({"type": "user_created", "user": user}), text=True)
     except Exception as e:
         log.exception("Failed to create user")
-        await ws.send(json.dumps({"type": "error", "message": f"Failed to create user: {e}"}))
+        await ws.send(orjson.dumps({"type": "error", "message": f"Failed to create user: {e}"}), text=True)
 
 
 async def _handle_delete_user(ws: ServerConnection, msg: dict, user_id: str, admin: bool) -> None:
     if not admin:
-        await ws.send(json.dumps({"type": "error", "message": "Admin only"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Admin only"}), text=True)
         return
     target_id = (msg.get("user_id") or "").strip()
     if not target_id:
-        await ws.send(json.dumps({"type": "error", "message": "Missing user_id"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Missing user_id"}), text=True)
         return
     if target_id == user_id:
-        await ws.send(json.dumps({"type": "error", "message": "Cannot delete yourself"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Cannot delete yourself"}), text=True)
         return
     try:
         await supabase_client.admin_delete_user(target_id)
-        await ws.send(json.dumps({"type": "user_deleted", "user_id": target_id}))
+        await ws.send(orjson.dumps({"type": "user_deleted", "user_id": target_id}), text=True)
     except Exception as e:
         log.exception("Failed to delete user %s", target_id)
-        await ws.send(json.dumps({"type": "error", "message": f"Failed to delete user: {e}"}))
+        await ws.send(orjson.dumps({"type": "error", "message": f"Failed to delete user: {e}"}), text=True)
 
 
 async def _handle_ask(ws: ServerConnection, msg: dict, user_id: str, admin: bool) -> None:
@@ -1153,16 +1512,16 @@ async def _handle_ask(ws: ServerConnection, msg: dict, user_id: str, admin: bool
     bot_id = (msg.get("bot_id") or "").strip()
     question = (msg.get("question") or "").strip()
     if not bot_id or not question:
-        await ws.send(json.dumps({"type": "error", "message": "Missing bot_id or question"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Missing bot_id or question"}), text=True)
         return
 
     # Verify access
     session_data = await supabase_client.get_session(bot_id)
     if not session_data:
-        await ws.send(json.dumps({"type": "error", "message": "Session not found"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Session not found"}), text=True)
         return
     if session_data.get("user_id") != user_id and not admin:
-        await ws.send(json.dumps({"type": "error", "message": "Not authorized"}))
+        await ws.send(orjson.dumps({"type": "error", "message": "Not authorized"}), text=True)
         return
 
     # Load transcript
@@ -1173,23 +1532,22 @@ async def _handle_ask(ws: ServerConnection, msg: dict, user_id: str, admin: bool
         )
         transcript_text = ""
         if signed_url:
-            async with httpx.AsyncClient(timeout=15) as client:
-                resp = await client.get(signed_url)
-                if resp.status_code == 200:
-                    lines = []
-                    for line in resp.text.strip().split("\n"):
-                        if not line:
-                            continue
-                        entry = json.loads(line)
-                        speaker = entry.get("speaker", entry.get("participant_id", "Unknown"))
-                        text = entry.get("text", entry.get("original", ""))
-                        elapsed = entry.get("elapsed", 0)
-                        mins, secs = divmod(int(elapsed), 60)
-                        lines.append(f"[{mins:02d}:{secs:02d}] {speaker}: {text}")
-                    transcript_text = "\n".join(lines)
+            resp = await supabase_client.download(signed_url, timeout=15)
+            if resp.status_code == 200:
+                lines = []
+                for line in resp.text.strip().split("\n"):
+                    if not line:
+                        continue
+                    entry = orjson.loads(line)
+                    speaker = entry.get("speaker", entry.get("participant_id", "Unknown"))
+                    text = entry.get("text", entry.get("original", ""))
+                    elapsed = entry.get("elapsed", 0)
+                    mins, secs = divmod(int(elapsed), 60)
+                    lines.append(f"[{mins:02d}:{secs:02d}] {speaker}: {text}")
+                transcript_text = "\n".join(lines)
 
         if not transcript_text:
-            await ws.send(json.dumps({"type": "answer", "bot_id": bot_id, "answer": "No transcript available."}))
+            await ws.send(orjson.dumps({"type": "answer", "bot_id": bot_id, "answer": "No transcript available."}), text=True)
             return
 
         resp = await _anthropic.messages.create(
@@ -1206,10 +1564,57 @@ async def _handle_ask(ws: ServerConnection, msg: dict, user_id: str, admin: bool
             ],
         )
         answer = resp.content[0].text
-        await ws.send(json.dumps({"type": "answer", "bot_id": bot_id, "answer": answer}))
+        await ws.send(orjson.dumps({"type": "answer", "bot_id": bot_id, "answer": answer}), text=True)
     except Exception as e:
         log.exception("Failed to answer question for %s", bot_id)
-        await ws.send(json.dumps({"type": "error", "message": f"Failed to get answer: {e}"}))
+        await ws.send(orjson.dumps({"type": "error", "message": f"Failed to get answer: {e}"}), text=True)
+
+
+async def open_asr(session: BotSession, participant_id: str) -> ASRStream | ASRChannel:
+    """Start ASR for a participant: a channel on the session's multichannel
+    stream when enabled and one is free, otherwise a dedicated stream."""
+    stream = None
+    if config.ASR_MULTICHANNEL:
+        if session.session_asr is None:
+            session.session_asr = SessionASR(
+                session.on_utterance, source_lang=session.source_lang, channels=config.ASR_CHANNELS
+            )
+            await session.session_asr.start()
+        stream = session.session_asr.channel(participant_id)
+    if stream is None:
+        stream = await acquire_stream(
+            session.bot_id, participant_id, session.on_utterance, source_lang=session.source_lang
+        )
+
+    # Billed streams: every multichannel channel, plus each dedicated stream
+    billed = sum(1 for s in session.asr_streams.values() if isinstance(s, ASRStream))
+    billed += isinstance(stream, ASRStream)
+    if session.session_asr:
+        billed += session.session_asr.channels
+    session.deepgram_participants = max(session.deepgram_participants, billed)
+    return stream
+
+
+async def close_asr(session: BotSession) -> None:
+    """Close every ASR stream for a session that is ending, including the
+    shared multichannel one and any it left in the stream pool."""
+    session.last_audio_source = None
+    for pid in list(session.asr_streams):
+        stream = session.asr_streams.pop(pid, None)
+        if stream:
+            await stream.close()
+    await discard_streams(session.bot_id)
+    if session.session_asr:
+        await session.session_asr.close()
+        session.session_asr = None
+
+
+async def _close_stream(stream: ASRStream | ASRChannel) -> None:
+    # A departing participant's dedicated stream is pooled so a rejoin can reuse it
+    if isinstance(stream, ASRStream):
+        await release_stream(stream)
+    else:
+        await stream.close()
 
 
 # ── Listener WebSocket handler (/listen) ──────────────────────────────
@@ -1217,17 +1622,17 @@ async def _handle_ask(ws: ServerConnection, msg: dict, user_id: str, admin: bool
 async def listen_handler(ws: ServerConnection) -> None:
     """Handle listener browser WebSocket connections."""
     path = ws.request.path if ws.request else "/listen"
-    qs = parse_qs(urlparse(path).query)
-    lang = qs.get("lang", [""])[0].lower()
+    lang = _query_param(path, "lang").lower()
 
     if not lang:
         await ws.close(1008, "Missing ?lang= parameter")
         return
 
-    if lang not in listener_clients:
-        listener_clients[lang] = set()
-    listener_clients[lang].add(ws)
-    log.info("Listener connected for lang=%s (%d total)", lang, len(listener_clients[lang]))
+    listener = Listener(ws)
+    listener.start()
+    listeners = listener_clients.setdefault(lang, [])
+    listeners.append(listener)
+    log.info("Listener connected for lang=%s (%d total)", lang, _live_count(listeners))
 
     try:
         async for _ in ws:
@@ -1235,67 +1640,244 @@ async def listen_handler(ws: ServerConnection) -> None:
     except websockets.exceptions.ConnectionClosed:
         pass
     finally:
-        listener_clients.get(lang, set()).discard(ws)
-        remaining = len(listener_clients.get(lang, set()))
+        listener.dead = True
+        listener.stop()
+        _compact_listeners(lang)
+        remaining = _live_count(listener_clients.get(lang, []))
         log.info("Listener disconnected for lang=%s (%d remaining)", lang, remaining)
 
 
-async def broadcast_audio(lang: str, mp3_b64: str, original: str = "", translated: str = "") -> None:
-    """Send an MP3 audio clip to all listener browsers for a language."""
-    clients = listener_clients.get(lang, set())
-    if not clients:
+def _live_count(listeners: list[Listener]) -> int:
+    return sum(1 for listener in listeners if not listener.dead)
+
+
+def _compact_listeners(lang: str) -> None:
+    """Drop dead listeners for *lang* once they exceed LISTENER_COMPACT_RATIO."""
+    listeners = listener_clients.get(lang)
+    if not listeners:
         return
-    msg = json.dumps({"type": "audio", "mp3": mp3_b64, "original": original, "translated": translated})
-    stale = set()
-    for ws in clients:
-        try:
-            await ws.send(msg)
-        except Exception:
-            stale.add(ws)
-    clients.difference_update(stale)
+    dead = len(listeners) - _live_count(listeners)
+    if dead > len(listeners) * LISTENER_COMPACT_RATIO:
+        # In place, so the list object stays stable; broadcasts work on copies
+        listeners[:] = [listener for listener in listeners if not listener.dead]
+
+
+def _send_to_listeners(targets: list[Listener], message: str | bytes) -> None:
+    """Queue one message (str or TextFrame → text frame, other bytes →
+    binary) for live *targets*.
+
+    A listener that falls SEND_QUEUE_SIZE messages behind is disconnected
+    rather than holding everyone else up; dropping frames mid-clip would
+    corrupt its MP3 stream. The page plays whatever part of the interrupted
+    clip it received (its onclose finishes pending clips), then reconnects.
+    """
+    for listener in targets:
+        if not listener.dead and not listener.enqueue(message):
+            listener.dead = True
+            listener.disconnect("Listener too slow")
+
+
+async def broadcast_audio_stream(
+    lang: str, mp3_chunks: AsyncIterator[bytes], original: str = "", translated: str = ""
+) -> bytes:
+    """Stream an MP3 clip to all listener browsers for a language as it is synthesized.
+
+    Listeners receive an ``audio_start`` text frame, then binary frames of
+    MP3 data (each prefixed with the 4-byte big-endian clip id, so clips
+    from concurrent utterances can't get mixed up), then ``audio_end``.
+
+    Returns:
+        The complete MP3 clip, for recording.
+    """
+    clip_id = next(_clip_ids) & 0xFFFFFFFF
+    header = clip_id.to_bytes(4, "big")
+    # Clients that connect mid-clip start with the next one
+    targets = [listener for listener in listener_clients.get(lang, []) if not listener.dead]
+
+    if targets:
+        start = TextFrame(orjson.dumps({
+            "type": "audio_start", "id": clip_id,
+            "original": original, "translated": translated,
+        }))
+        _send_to_listeners(targets, start)
+
+    mp3 = bytearray()
+    try:
+        async for chunk in mp3_chunks:
+            mp3 += chunk
+            if targets:
+                _send_to_listeners(targets, header + chunk)
+    finally:
+        # Always close the clip so listeners don't wait on a failed synthesis
+        if targets:
+            end = TextFrame(orjson.dumps({"type": "audio_end", "id": clip_id}))
+            _send_to_listeners(targets, end)
+            _compact_listeners(lang)
+    return bytes(mp3)
 
 
 # ── Recording ─────────────────────────────────────────────────────────
 
+def _session_clock() -> float:
+    """Monotonic seconds for recording timestamps (the event loop's clock:
+    no wall-clock syscall, and immune to system clock adjustments)."""
+    return asyncio.get_running_loop().time()
+
+
 def _init_recording(session: BotSession) -> None:
-    session.recording_start = time.time()
-    session.srt_buffer = ""
-    session.transcript_buffer = ""
+    session.recording_start = _session_clock()
+    if session.clip_flusher is None:
+        session.clip_flusher = asyncio.create_task(_clip_flusher(session))
     log.info("Recording initialized for bot %s (cloud storage)", session.bot_id)
 
 
+# Clips are uploaded in batches rather than one task per utterance, with a
+# single clip_count DB update per batch
+CLIP_FLUSH_INTERVAL = 5.0  # seconds
+
+
+async def _flush_clips(session: BotSession, update_count: bool = True) -> None:
+    if not session.pending_clips:
+        return
+    clips = list(session.pending_clips)
+    session.pending_clips.clear()
+    await supabase_client.upload_clips(session.user_id, session.bot_id, clips)
+    if update_count and session.status != "stopped":
+        await supabase_client.update_session_status(
+            session.bot_id, "in_call", clip_count=clips[-1][0]
+        )
+
+
+async def _clip_flusher(session: BotSession) -> None:
+    """Background task: upload the session's queued clips every
+    CLIP_FLUSH_INTERVAL until clips_done is set."""
+    while True:
+        try:
+            await asyncio.wait_for(session.clips_done.wait(), timeout=CLIP_FLUSH_INTERVAL)
+            return
+        except asyncio.TimeoutError:
+            pass
+        try:
+            await _flush_clips(session)
+        except Exception:
+            log.exception("Clip flush failed for %s", session.bot_id[:8])
+
+
+async def _finish_clips(session: BotSession) -> None:
+    """Stop the clip flusher and upload whatever is still queued.
+
+    The flusher is signalled rather than cancelled: a batch it has already
+    taken off pending_clips must finish uploading, or those clips are lost.
+    The final session status update carries clip_count, so none is sent here.
+    """
+    task = session.clip_flusher
+    if task is not None:
+        session.clips_done.set()
+        await task
+        # Clips saved while the last batch uploaded are still queued
+        session.clip_flusher = None
+    await _flush_clips(session, update_count=False)
+
+
 def _format_srt_time(seconds: float) -> str:
-    if seconds < 0:
-        seconds = 0.0
-    h = int(seconds // 3600)
-    m = int((seconds % 3600) // 60)
-    s = int(seconds % 60)
-    ms = int((seconds % 1) * 1000)
+    # Round once to whole milliseconds, then integer math only — float
+    # modulo truncated e.g. 1.001 s to 1,000
+    ms = max(int(seconds * 1000 + 0.5), 0)
+    h, ms = divmod(ms, 3_600_000)
+    m, ms = divmod(ms, 60_000)
+    s, ms = divmod(ms, 1000)
     return f"{h:02d}:{m:02d}:{s:02d},{ms:03d}"
 
 
-def save_recording(session: BotSession, mp3_b64: str, original: str, translated: str) -> None:
-    mp3_bytes = base64.b64decode(mp3_b64)
+def _format_srt_range(start: float, end: float) -> str:
+    """SRT cue timing line (without newline), e.g. ``00:00:01,000 --> 00:00:02,500``."""
+    return f"{_format_srt_time(start)} --> {_format_srt_time(end)}"
+
+
+# MP3 frame header tables, indexed by [version][layer][bitrate index] in kbps.
+# version: 3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5; layer: 3 = I, 2 = II, 1 = III
+_MP3_BITRATES_V1 = {
+    3: (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    2: (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    1: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+}
+_MP3_BITRATES_V2 = {
+    3: (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    1: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_MP3_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+
+
+def _mp3_duration(data: bytes) -> float:
+    """Return the duration of an MP3 in seconds by walking its frame headers.
+
+    Handles CBR and VBR alike; only 4 header bytes per frame are read.
+    Falls back to a 64 kbps estimate if no valid frames are found.
+    """
+    pos = 0
+    # Skip an ID3v2 tag (size is a 28-bit syncsafe integer)
+    if data[:3] == b"ID3" and len(data) >= 10:
+        pos = 10 + ((data[6] << 21) | (data[7] << 14) | (data[8] << 7) | data[9])
+
+    duration = 0.0
+    end = len(data) - 4
+    while pos <= end:
+        b1, b2 = data[pos + 1], data[pos + 2]
+        version, layer = (b1 >> 3) & 3, (b1 >> 1) & 3
+        bitrate_idx, rate_idx = b2 >> 4, (b2 >> 2) & 3
+        if (data[pos] != 0xFF or (b1 & 0xE0) != 0xE0 or version == 1 or layer == 0
+                or bitrate_idx in (0, 15) or rate_idx == 3):
+            # Not a frame header — resync at the next 0xFF
+            pos = data.find(b"\xff", pos + 1)
+            if pos < 0:
+                break
+            continue
+
+        table = _MP3_BITRATES_V1 if version == 3 else _MP3_BITRATES_V2
+        bitrate = table[layer][bitrate_idx] * 1000
+        sample_rate = _MP3_SAMPLE_RATES[version][rate_idx]
+        if layer == 3:
+            samples, slot = 384, 4
+        elif layer == 1 and version != 3:
+            samples, slot = 576, 1
+        else:
+            samples, slot = 1152, 1
+        padding = (b2 >> 1) & 1
+
+        duration += samples / sample_rate
+        pos += (samples // 8 * bitrate // sample_rate // slot + padding) * slot
+
+    return duration or len(data) / 8000.0
+
+
+def save_recording(session: BotSession, mp3_bytes: bytes, original: str, translated: str) -> None:
     session.clip_count += 1
+    _mark_status_dirty()
     n = session.clip_count
 
-    # Upload clip to Supabase Storage (fire-and-forget)
-    asyncio.create_task(supabase_client.upload_clip(
-        session.user_id, session.bot_id, n, mp3_bytes
-    ))
+    # Queue clip for the next batched upload to Supabase Storage; a clip
+    # finishing after the session stopped has no flusher left, so send it now
+    if session.clip_flusher is not None:
+        session.pending_clips.append((n, mp3_bytes))
+    else:
+        asyncio.create_task(supabase_client.upload_clip(
+            session.user_id, session.bot_id, n, mp3_bytes
+        ))
 
-    # Estimate clip duration (~64 kbps = 8000 bytes/sec)
-    duration = len(mp3_bytes) / 8000.0
+    duration = _mp3_duration(mp3_bytes)
     start = session.audio_offset
     session.audio_offset += duration
 
     # Append to in-memory SRT buffer
-    session.srt_buffer += f"{n}\n"
-    session.srt_buffer += f"{_format_srt_time(start)} --> {_format_srt_time(session.audio_offset)}\n"
-    session.srt_buffer += f"{translated}\n\n"
+    session.append_srt((
+        f"{n}\n"
+        f"{_format_srt_range(start, session.audio_offset)}\n"
+        f"{translated}\n\n"
+    ).encode())
 
     # Append to in-memory transcript buffer (JSONL)
-    elapsed = time.time() - session.recording_start
+    elapsed = _session_clock() - session.recording_start
     entry = {
         "n": n,
         "elapsed": round(elapsed, 2),
@@ -1304,93 +1886,127 @@ def save_recording(session: BotSession, mp3_b64: str, original: str, translated:
         "original": original,
         "translated": translated,
     }
-    session.transcript_buffer += json.dumps(entry, ensure_ascii=False) + "\n"
-
-    # Update DB clip count periodically (fire-and-forget)
-    asyncio.create_task(supabase_client.update_session_status(
-        session.bot_id, "in_call", clip_count=n
-    ))
+    session.append_transcript(entry)
 
 
 # ── Pipeline callback chain (per-session) ─────────────────────────────
 
-def make_on_utterance(session: BotSession):
-    """Create an utterance callback bound to a specific bot session."""
-    async def on_utterance(participant_id: str, text: str) -> None:
-        target_lang = session.target_lang
-        speaker = session.participant_names.get(participant_id, participant_id[:8])
-
-        # Always record transcript, even if translation/TTS fails
-        elapsed = time.time() - session.recording_start if session.recording_start else 0
-        transcript_entry = {
-            "elapsed": round(elapsed, 2),
-            "speaker": speaker,
-            "text": text,
-        }
+async def handle_utterance(session: BotSession, participant_id: str, text: str) -> None:
+    """Translate mode: record transcript, translate, synthesize and broadcast."""
+    target_lang = session.target_lang
+    speaker = session.participant_names.get(participant_id, participant_id[:8])
 
-        session.deepl_chars += len(text)
-        translated = await translate(text, target_lang)
-        if translated is None:
-            transcript_entry["translated"] = None
-            session.transcript_buffer += json.dumps(transcript_entry, ensure_ascii=False) + "\n"
-            return
+    # Always record transcript, even if translation/TTS fails
+    elapsed = _session_clock() - session.recording_start if session.recording_start else 0
+    transcript_entry = {
+        "elapsed": round(elapsed, 2),
+        "speaker": speaker,
+        "text": text,
+    }
 
-        transcript_entry["translated"] = translated
-        session.transcript_buffer += json.dumps(transcript_entry, ensure_ascii=False) + "\n"
+    if session.source_lang == target_lang:
+        translated = None  # speaker is already in the target language
+    else:
+        translated = await translate(text, target_lang, on_billed=session.add_deepl_chars)
+    if translated is None:
+        transcript_entry["translated"] = None
+        session.append_transcript(transcript_entry)
+        return
 
-        session.tts_chars += len(translated)
-        mp3_b64 = await synthesize(translated, target_lang)
-        await broadcast_audio(target_lang, mp3_b64, original=text, translated=translated)
-        save_recording(session, mp3_b64, text, translated)
+    transcript_entry["translated"] = translated
+    session.append_transcript(transcript_entry)
 
-    return on_utterance
+    mp3_bytes = await broadcast_audio_stream(
+        target_lang, synthesize_sentences(translated, target_lang, session.add_tts_chars),
+        original=text, translated=translated,
+    )
+    save_recording(session, mp3_bytes, text, translated)
 
 
-def make_on_utterance_notes(session: BotSession):
-    """Create an utterance callback for notes mode (transcribe only, no translation/TTS)."""
-    async def on_utterance(participant_id: str, text: str) -> None:
-        speaker = session.participant_names.get(participant_id, participant_id[:8])
-        elapsed = time.time() - session.recording_start if session.recording_start else 0
-        entry = {
-            "elapsed": round(elapsed, 2),
-            "speaker": speaker,
-            "text": text,
-        }
-        session.transcript_buffer += json.dumps(entry, ensure_ascii=False) + "\n"
 
-    return on_utterance
+async def handle_utterance_notes(session: BotSession, participant_id: str, text: str) -> None:
+    """Notes mode: record transcript only, no translation/TTS."""
+    speaker = session.participant_names.get(participant_id, participant_id[:8])
+    elapsed = _session_clock() - session.recording_start if session.recording_start else 0
+    entry = {
+        "elapsed": round(elapsed, 2),
+        "speaker": speaker,
+        "text": text,
+    }
+    session.append_transcript(entry)
 
 
-def make_on_utterance_both(session: BotSession):
-    """Create an utterance callback that does translation+TTS AND records transcript."""
-    async def on_utterance(participant_id: str, text: str) -> None:
-        # Record transcript with speaker labels (same as notes mode)
-        speaker = session.participant_names.get(participant_id, participant_id[:8])
-        elapsed = time.time() - session.recording_start if session.recording_start else 0
-        entry = {
-            "elapsed": round(elapsed, 2),
-            "speaker": speaker,
-            "text": text,
-        }
-        session.transcript_buffer += json.dumps(entry, ensure_ascii=False) + "\n"
 
-        # Translate + TTS + broadcast (same as translate mode)
-        target_lang = session.target_lang
-        session.deepl_chars += len(text)
-        translated = await translate(text, target_lang)
-        if translated is None:
-            return
+async def handle_utterance_both(session: BotSession, participant_id: str, text: str) -> None:
+    """Both mode: translation+TTS AND a speaker-labelled transcript."""
+    # Record transcript with speaker labels (same as notes mode)
+    speaker = session.participant_names.get(participant_id, participant_id[:8])
+    elapsed = _session_clock() - session.recording_start if session.recording_start else 0
+    entry = {
+        "elapsed": round(elapsed, 2),
+        "speaker": speaker,
+        "text": text,
+    }
+    session.append_transcript(entry)
 
-        session.tts_chars += len(translated)
-        mp3_b64 = await synthesize(translated, target_lang)
-        await broadcast_audio(target_lang, mp3_b64, original=text, translated=translated)
-        save_recording(session, mp3_b64, text, translated)
+    # Translate + TTS + broadcast (same as translate mode)
+    target_lang = session.target_lang
+    if session.source_lang == target_lang:
+        translated = None  # speaker is already in the target language
+    else:
+        translated = await translate(text, target_lang, on_billed=session.add_deepl_chars)
+    if translated is None:
+        return
+
+    mp3_bytes = await broadcast_audio_stream(
+        target_lang, synthesize_sentences(translated, target_lang, session.add_tts_chars),
+        original=text, translated=translated,
+    )
+    save_recording(session, mp3_bytes, text, translated)
 
-    return on_utterance
 
 
 # ── Recall.ai audio handler (default path) ────────────────────────────
 
+# Schema for the Recall.ai event fields we use; everything else is skipped
+# by the decoder. ``buffer`` is base64 in the JSON and decodes straight to PCM.
+class RecallParticipant(msgspec.Struct):
+    id: int | str | None = None
+    name: str | None = None
+
+
+class RecallEventData(msgspec.Struct):
+    participant: RecallParticipant | None = None
+    buffer: bytes = b""
+
+
+class RecallBot(msgspec.Struct):
+    id: str | None = None
+
+
+class RecallData(msgspec.Struct):
+    bot: RecallBot | None = None
+    data: RecallEventData | None = None
+
+
+class RecallEvent(msgspec.Struct):
+    event: str | None = None
+    data: RecallData | None = None
+
+
+_recall_decoder = msgspec.json.Decoder(RecallEvent)
+# Same schema for a MessagePack envelope, where ``buffer`` is raw bin PCM
+# (no base64 at all); JSON stays the default and the fallback
+_recall_msgpack_decoder = msgspec.msgpack.Decoder(RecallEvent)
+
+
+def _decode_recall(raw_msg: str | bytes) -> RecallEvent:
+    # A JSON object always starts with "{"; a binary frame that doesn't is MessagePack
+    if isinstance(raw_msg, bytes) and raw_msg[:1] != b"{":
+        return _recall_msgpack_decoder.decode(raw_msg)
+    return _recall_decoder.decode(raw_msg)
+
+
 async def recall_handler(ws: ServerConnection) -> None:
     """Handle Recall.ai bot WebSocket connections for audio streaming."""
     remote = ws.remote_address
@@ -1401,18 +2017,20 @@ async def recall_handler(ws: ServerConnection) -> None:
     try:
         async for raw_msg in ws:
             try:
-                msg: dict[str, Any] = json.loads(raw_msg)
-            except (json.JSONDecodeError, TypeError):
-                log.warning("Non-JSON message received, ignoring")
+                # Inline: msgspec holds the GIL while decoding, so a worker
+                # thread would only add two hops per frame
+                msg = _decode_recall(raw_msg)
+            except msgspec.DecodeError:
+                log.warning("Malformed Recall.ai message received, ignoring")
                 continue
 
-            event = msg.get("event")
-            data = msg.get("data", {})
+            event = msg.event
+            data = msg.data or RecallData()
+            inner = data.data or RecallEventData()
 
             # Extract bot_id from the message envelope and look up session
             if session is None:
-                bot_data = data.get("bot") or {}
-                incoming_bot_id = bot_data.get("id")
+                incoming_bot_id = data.bot.id if data.bot else None
                 if incoming_bot_id:
                     session = bot_sessions.get(incoming_bot_id)
                     if session:
@@ -1428,7 +2046,7 @@ async def recall_handler(ws: ServerConnection) -> None:
                             target_lang=config.TARGET_LANGUAGE,
                             status="in_call",
                         )
-                        bot_sessions[incoming_bot_id] = session
+                        _add_session(session)
                         _init_recording(session)
                         await broadcast_status()
 
@@ -1436,52 +2054,48 @@ async def recall_handler(ws: ServerConnection) -> None:
                 if session is None:
                     continue
 
-                inner = data.get("data", {})
-                participant = inner.get("participant", {})
-                participant_id = str(participant.get("id", "unknown"))
-                participant_name = participant.get("name", "")
+                participant = inner.participant or RecallParticipant()
+                last = session.last_audio_source
+                if last is not None and participant.id == last[0]:
+                    if inner.buffer:
+                        await last[1].send_audio(inner.buffer)
+                    continue
+
+                participant_id = str(participant.id) if participant.id is not None else "unknown"
+                participant_name = participant.name or ""
 
                 # Skip bot's own audio to avoid feedback loops
                 if participant_name.startswith("Translator") or participant_name == "Meeting Notes":
                     continue
 
-                audio_b64 = inner.get("buffer", "")
-                if not audio_b64:
+                pcm_bytes = inner.buffer
+                if not pcm_bytes:
                     continue
 
-                pcm_bytes = base64.b64decode(audio_b64)
-
                 # Store participant name for speaker labels
                 if participant_id not in session.participant_names and participant_name:
                     session.participant_names[participant_id] = participant_name
 
                 # Get or create ASR stream for this participant in this session
-                if participant_id not in session.asr_streams:
-                    if session.mode == "notes":
-                        on_utterance = make_on_utterance_notes(session)
-                    elif session.mode == "both":
-                        on_utterance = make_on_utterance_both(session)
-                    else:
-                        on_utterance = make_on_utterance(session)
-                    stream = ASRStream(participant_id, on_utterance, source_lang=session.source_lang)
-                    await stream.start()
-                    session.asr_streams[participant_id] = stream
-                    session.deepgram_participants = max(
-                        session.deepgram_participants, len(session.asr_streams)
-                    )
+                stream = session.asr_streams.get(participant_id)
+                if stream is None:
+                    stream = session.asr_streams[participant_id] = await open_asr(session, participant_id)
+                if participant.id is not None:
+                    session.last_audio_source = (participant.id, stream)
 
-                await session.asr_streams[participant_id].send_audio(pcm_bytes)
+                await stream.send_audio(pcm_bytes)
 
             elif event == "participant_events.leave":
                 if session is None:
                     continue
-                inner = data.get("data", {})
-                participant_id = str(inner.get("participant", {}).get("id", ""))
+                participant = inner.participant
+                participant_id = str(participant.id) if participant and participant.id is not None else ""
                 if participant_id:
                     log.info("Participant left: %s", participant_id)
+                    session.last_audio_source = None
                     stream = session.asr_streams.pop(participant_id, None)
                     if stream:
-                        await stream.close()
+                        await _close_stream(stream)
 
             else:
                 log.debug("Unhandled event: %s", event)
@@ -1491,62 +2105,75 @@ async def recall_handler(ws: ServerConnection) -> None:
     finally:
         # Tear down ASR streams and finalize session
         if session:
-            for pid in list(session.asr_streams):
-                stream = session.asr_streams.pop(pid, None)
-                if stream:
-                    await stream.close()
+            await close_asr(session)
 
             # If session wasn't already stopped via management UI, finalize it now
             if session.status != "stopped":
                 log.info("Finalizing session %s after WebSocket disconnect", session.bot_id)
                 session.status = "stopped"
+                _mark_status_dirty()
                 await broadcast_status()
+                await _finish_clips(session)
 
-                if session.transcript_buffer:
+                if session.has_transcript:
                     asyncio.create_task(supabase_client.upload_text_file(
-                        session.user_id, session.bot_id, "transcript.jsonl", session.transcript_buffer
+                        session.user_id, session.bot_id, "transcript.jsonl", session.transcript_bytes
                     ))
 
-                if session.srt_buffer:
+                if session.has_subtitles:
                     asyncio.create_task(supabase_client.upload_text_file(
-                        session.user_id, session.bot_id, "subtitles.srt", session.srt_buffer
+                        session.user_id, session.bot_id, "subtitles.srt", session.srt_bytes
                     ))
 
-                if session.mode in ("notes", "both") and session.transcript_buffer:
+                if session.mode in ("notes", "both") and session.has_transcript:
                     await _generate_meeting_summary(session)
 
-                meeting_minutes = (time.time() - session.recording_start) / 60.0 if session.recording_start else 0
+                meeting_minutes = (_session_clock() - session.recording_start) / 60.0 if session.recording_start else 0
                 costs = _calculate_costs(session, meeting_minutes)
                 log.info(
                     "Session costs for %s (auto-finalized): total=$%.2f",
                     session.bot_id[:8], costs["total"],
                 )
                 duration = meeting_minutes * 60 if session.mode in ("notes", "both") else session.audio_offset
-                asyncio.create_task(supabase_client.update_session_status(
-                    session.bot_id, "stopped",
+                asyncio.create_task(_store_final_status(
+                    session,
                     clip_count=session.clip_count,
                     duration=round(duration, 1),
                     api_cost=round(costs["total"], 4),
                 ))
-                bot_sessions.pop(session.bot_id, None)
+                _remove_session(session.bot_id)
 
 
 # ── Main handler with path routing ────────────────────────────────────
 
+def _query_param(path: str, name: str) -> str:
+    """First value of query parameter *name* in *path*, or "" if absent.
+
+    Connections only ever need one parameter, so this skips building the
+    full urlparse()/parse_qs() result.
+    """
+    _, _, query = path.partition("?")
+    for pair in query.split("&"):
+        key, _, value = pair.partition("=")
+        if key == name:
+            return unquote_plus(value)
+    return ""
+
+
 async def handler(ws: ServerConnection) -> None:
     """Route WebSocket connections based on request path."""
     path = ws.request.path if ws.request else "/"
-    parsed = urlparse(path)
+    route, _, _ = path.partition("?")
 
-    if parsed.path == "/mgmt":
+    if route == "/mgmt":
         # Validate JWT from query string
-        token = parse_qs(parsed.query).get("token", [""])[0]
+        token = _query_param(path, "token")
         user = await supabase_client.verify_jwt(token)
         if not user:
             await ws.close(1008, "Invalid auth token")
             return
         await mgmt_handler(ws, user)
-    elif parsed.path.startswith("/listen"):
+    elif route.startswith("/listen"):
         await listen_handler(ws)
     else:
         await recall_handler(ws)
@@ -1555,17 +2182,29 @@ async def handler(ws: ServerConnection) -> None:
 # ── Entry point ───────────────────────────────────────────────────────
 
 async def main() -> None:
+    # The C extension does frame masking and UTF-8 validation for every
+    # audio frame; without it websockets silently falls back to pure Python
+    try:
+        import websockets.speedups  # noqa: F401
+    except ImportError:
+        log.warning("websockets C speedups not available — WebSocket framing will be slow")
+
     stop = asyncio.Event()
 
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, stop.set)
 
+    status_task = asyncio.create_task(_status_coalescer())
+
     async with serve(
         handler,
         config.WEBSOCKET_HOST,
         config.WEBSOCKET_PORT,
         process_request=process_request,
+        # Traffic is base64 PCM from Recall and MP3 to listeners; deflate
+        # barely shrinks either and costs CPU on every frame.
+        compression=None,
     ):
         log.info(
             "Server listening on http://%s:%s",
@@ -1574,8 +2213,21 @@ async def main() -> None:
         )
         await stop.wait()
 
+    status_task.cancel()
+    await close_recall()
+    await supabase_client.close()
+    await close_asr_pool()
+    await close_translator()
     log.info("Server shut down.")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop's libuv-based loop cuts per-send/recv overhead on the WebSocket
+    # fan-out; fall back to the stock loop where it isn't installed.
+    # (Both loops already set TCP_NODELAY on every TCP connection.)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -1,45 +1,185 @@
 """Supabase wrapper — auth, database, and storage helpers.
 
 Uses the service-role key server-side (bypasses RLS for writes).
-All synchronous Supabase SDK calls are wrapped in asyncio.to_thread()
-to avoid blocking the event loop.
+All synchronous Supabase SDK calls run on a dedicated thread pool (see
+_run()) to avoid blocking the event loop.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Any
+from functools import partial
+from typing import Any, Callable, TypeVar
 
-from supabase import create_client, Client
+import httpx
+import orjson
+import pybase64
+from supabase import create_client, Client, ClientOptions
+from supabase_auth.errors import AuthRetryableError
 
 import config
 
 log = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# Own executor for SDK calls, so bursts of storage uploads can't starve JWT
+# checks in asyncio's small default pool (and vice versa)
+_executor = ThreadPoolExecutor(max_workers=config.SUPABASE_POOL_SIZE, thread_name_prefix="supabase")
+
+
+# Transient failures are retried with exponential backoff and jitter.
+# Errors raised before the request was sent are safe to retry for any call;
+# the rest may have reached Supabase, so only idempotent calls retry them.
+# (httpx already replaces a broken pooled connection, so a retry reconnects.)
+RETRY_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.25
+RETRY_MAX_DELAY = 10.0
+
+_UNSENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+_TRANSIENT_ERRORS = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError, AuthRetryableError)
+
+
+async def _run(fn: Callable[[], T], idempotent: bool = True) -> T:
+    """Run a blocking SDK call on the Supabase executor, retrying transient failures.
+
+    *fn* is a query builder's bound ``execute`` or a ``partial`` of a
+    storage/auth method; builders are assembled on the loop (no I/O) so
+    only the request itself runs on the pool.
+    """
+    loop = asyncio.get_running_loop()
+    retryable = _TRANSIENT_ERRORS if idempotent else _UNSENT_ERRORS
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            return await loop.run_in_executor(_executor, fn)
+        except retryable as exc:
+            if attempt == RETRY_ATTEMPTS - 1:
+                raise
+            delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt) * (0.5 + random.random())
+            log.warning("Supabase call failed (%s), retry %d in %.2fs",
+                        type(exc).__name__, attempt + 1, delay)
+            await asyncio.sleep(delay)
+    raise AssertionError("unreachable")
+
+
+# One bounded, keep-alive connection pool for every SDK call (REST, Storage,
+# Auth), which run from worker threads. Limits live on the transport: with
+# a custom transport httpx ignores the client's own. retries=3 only retries
+# failed connects, so it is safe for non-idempotent uploads. Its timeout
+# applies to every service: given an http client, postgrest and storage3
+# ignore their own timeout options.
+_sdk_http = httpx.Client(
+    timeout=httpx.Timeout(60.0, connect=10.0),
+    transport=httpx.HTTPTransport(
+        retries=3,
+        limits=httpx.Limits(
+            max_connections=config.SUPABASE_POOL_SIZE,
+            max_keepalive_connections=40,
+            keepalive_expiry=60,
+        ),
+    ),
+)
+
 # Service-role client — full access, used server-side only
-_client: Client = create_client(config.SUPABASE_URL, config.SUPABASE_SERVICE_ROLE_KEY)
+_client: Client = create_client(
+    config.SUPABASE_URL,
+    config.SUPABASE_SERVICE_ROLE_KEY,
+    options=ClientOptions(httpx_client=_sdk_http),
+)
+
+# Shared HTTP/2 client for fetching signed storage URLs, so repeated
+# transcript and clip downloads reuse one TLS connection. Created lazily so
+# it binds to the running event loop.
+_http: httpx.AsyncClient | None = None
+
+
+def _get_http() -> httpx.AsyncClient:
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            http2=True,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+    return _http
+
+
+async def close() -> None:
+    """Write queued status updates and close the shared HTTP client (call on shutdown)."""
+    global _http, _flush_handle
+    if _flush_handle is not None:
+        _flush_handle.cancel()
+        _flush_handle = None
+    if _flush_task is not None and not _flush_task.done():
+        await _flush_task
+    if _pending_updates:
+        await _flush_status_updates()
+    _sdk_http.close()
+    _executor.shutdown(wait=False)
+    if _http is not None:
+        await _http.aclose()
+        _http = None
 
 
 # ── Auth ──────────────────────────────────────────────────────────────
 
+# Verified tokens, keyed by a hash of the token: → (expires at, user dict).
+# The web UI re-sends the same token on every poll and reconnect, so most
+# checks skip the Auth API. Entries live until the JWT's exp, at most
+# JWT_CACHE_TTL, so a revoked session is accepted that long at worst.
+JWT_CACHE_TTL = 300.0
+JWT_CACHE_MAX_ENTRIES = 10_000
+
+_jwt_cache: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+
+
+def _jwt_exp(token: str) -> float | None:
+    """The ``exp`` claim of *token*, read without verifying the signature."""
+    try:
+        payload = token.split(".")[1]
+        claims = orjson.loads(pybase64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return float(claims["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
 async def verify_jwt(token: str) -> dict | None:
     """Verify a Supabase user JWT via the Auth API.
 
     Returns a dict with at least ``sub`` (user id) on success, or None.
     Uses the admin auth endpoint (service-role) so it works with both
     the new publishable/secret key system and legacy JWT-based keys.
+    Successful results are cached (see JWT_CACHE_TTL).
     """
     if not token:
         return None
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    cached = _jwt_cache.get(key)
+    if cached is not None:
+        if cached[0] > now:
+            _jwt_cache.move_to_end(key)
+            return cached[1]
+        del _jwt_cache[key]
+
     try:
-        resp = await asyncio.to_thread(
-            lambda: _client.auth.get_user(token)
-        )
+        resp = await _run(partial(_client.auth.get_user, token))
         user = resp.user
         if user and user.id:
-            return {"sub": user.id, "email": user.email}
+            result = {"sub": user.id, "email": user.email}
+            expires = min(_jwt_exp(token) or now, now + JWT_CACHE_TTL)
+            if expires > now:
+                _jwt_cache[key] = (expires, result)
+                if len(_jwt_cache) > JWT_CACHE_MAX_ENTRIES:
+                    _jwt_cache.popitem(last=False)
+            return result
     except Exception as exc:
         log.debug("JWT verification failed: %s", exc)
     return None
@@ -65,12 +205,41 @@ async def create_session(
         "mode": mode,
         "status": "in_call",
     }
-    resp = await asyncio.to_thread(
-        lambda: _client.table("bot_sessions").insert(row).execute()
-    )
+    resp = await _run(_client.table("bot_sessions").insert(row).execute, idempotent=False)
     return resp.data[0] if resp.data else row
 
 
+# Status updates are merged per bot_id and written once per
+# STATUS_FLUSH_DELAY tick; "stopped" is written immediately.
+STATUS_FLUSH_DELAY = 0.25
+
+_pending_updates: dict[str, dict[str, Any]] = {}
+_flush_handle: asyncio.TimerHandle | None = None
+_flush_task: asyncio.Task | None = None
+
+
+async def _update_row(bot_id: str, updates: dict[str, Any]) -> None:
+    await _run(_client.table("bot_sessions").update(updates).eq("bot_id", bot_id).execute)
+
+
+def _start_flush() -> None:
+    global _flush_handle, _flush_task
+    _flush_handle = None
+    _flush_task = asyncio.create_task(_flush_status_updates())
+
+
+async def _flush_status_updates() -> None:
+    batch = dict(_pending_updates)
+    _pending_updates.clear()
+    results = await asyncio.gather(
+        *(_update_row(bot_id, updates) for bot_id, updates in batch.items()),
+        return_exceptions=True,
+    )
+    for bot_id, result in zip(batch, results):
+        if isinstance(result, Exception):
+            log.error("Failed to update session %s: %s", bot_id, result)
+
+
 async def update_session_status(
     bot_id: str,
     status: str,
@@ -78,7 +247,14 @@ async def update_session_status(
     duration: float | None = None,
     api_cost: float | None = None,
 ) -> None:
-    """Update a session's status (and optionally clip_count / duration / api_cost)."""
+    """Update a session's status (and optionally clip_count / duration / api_cost).
+
+    Non-final updates are queued and merged with any others for the same
+    bot in the next flush. A "stopped" update absorbs the queued one and
+    is written before returning, after any flush already in flight, so a
+    late "in_call" write can't land on top of it.
+    """
+    global _flush_handle
     updates: dict[str, Any] = {"status": status}
     if clip_count is not None:
         updates["clip_count"] = clip_count
@@ -86,65 +262,68 @@ async def update_session_status(
         updates["duration"] = duration
     if api_cost is not None:
         updates["api_cost"] = api_cost
-    if status == "stopped":
-        updates["stopped_at"] = datetime.now(timezone.utc).isoformat()
-    await asyncio.to_thread(
-        lambda: _client.table("bot_sessions").update(updates).eq("bot_id", bot_id).execute()
-    )
+    if status != "stopped":
+        _pending_updates.setdefault(bot_id, {}).update(updates)
+        if _flush_handle is None:
+            _flush_handle = asyncio.get_running_loop().call_later(STATUS_FLUSH_DELAY, _start_flush)
+        return
+
+    updates["stopped_at"] = datetime.now(timezone.utc).isoformat()
+    updates = {**_pending_updates.pop(bot_id, {}), **updates}
+    if _flush_task is not None and not _flush_task.done():
+        await asyncio.shield(_flush_task)
+    await _update_row(bot_id, updates)
 
 
 async def update_session_summary(bot_id: str, summary: str) -> None:
     """Store the AI-generated meeting summary."""
-    await asyncio.to_thread(
-        lambda: _client.table("bot_sessions").update({"summary": summary}).eq("bot_id", bot_id).execute()
+    await _run(
+        _client.table("bot_sessions").update({"summary": summary}).eq("bot_id", bot_id).execute
     )
 
 
 async def get_session(bot_id: str) -> dict | None:
     """Return a single session by bot_id."""
-    resp = await asyncio.to_thread(
-        lambda: _client.table("bot_sessions").select("*").eq("bot_id", bot_id).limit(1).execute()
+    resp = await _run(
+        _client.table("bot_sessions").select("*").eq("bot_id", bot_id).limit(1).execute
     )
     return resp.data[0] if resp.data else None
 
 
-async def get_user_sessions(user_id: str) -> list[dict]:
-    """Return all sessions for a user, newest first."""
-    resp = await asyncio.to_thread(
-        lambda: (
-            _client.table("bot_sessions")
-            .select("*")
-            .eq("user_id", user_id)
-            .order("created_at", desc=True)
-            .execute()
-        )
+async def get_user_sessions(user_id: str, columns: str = "*") -> list[dict]:
+    """Return all sessions for a user, newest first.
+
+    *columns* is a PostgREST select list; list views pass only what they show.
+    """
+    resp = await _run(
+        _client.table("bot_sessions")
+        .select(columns)
+        .eq("user_id", user_id)
+        .order("created_at", desc=True)
+        .execute
     )
     return resp.data or []
 
 
-async def get_all_sessions() -> list[dict]:
+async def get_all_sessions(columns: str = "*") -> list[dict]:
     """Return all sessions across all users, newest first (admin only)."""
-    resp = await asyncio.to_thread(
-        lambda: (
-            _client.table("bot_sessions")
-            .select("*")
-            .order("created_at", desc=True)
-            .execute()
-        )
+    resp = await _run(
+        _client.table("bot_sessions")
+        .select(columns)
+        .order("created_at", desc=True)
+        .execute
     )
     return resp.data or []
 
 
-async def get_session_by_bot_id(bot_id: str) -> dict | None:
-    """Look up a single session by bot_id."""
-    resp = await asyncio.to_thread(
-        lambda: (
-            _client.table("bot_sessions")
-            .select("*")
-            .eq("bot_id", bot_id)
-            .limit(1)
-            .execute()
-        )
+async def get_session_by_bot_id(bot_id: str, columns: str = "*") -> dict | None:
+    """Look up a single session by bot_id, fetching only *columns*."""
+    resp = await _run(
+        _client.table("bot_sessions")
+        .select(columns)
+        .eq("bot_id", bot_id)
+        .limit(1)
+        .execute
     )
     return resp.data[0] if resp.data else None
 
@@ -153,32 +332,48 @@ async def get_session_by_bot_id(bot_id: str) -> dict | None:
 
 BUCKET = "recordings"
 
+# Built once: the bucket proxy and per-file-type upload options are
+# stateless (upload() copies the options), so every call can share them.
+# upsert so a retry after an ambiguous failure doesn't hit "Duplicate".
+_bucket = _client.storage.from_(BUCKET)
+_CLIP_OPTIONS = {"content-type": "audio/mpeg", "upsert": "true"}
+_TEXT_OPTIONS = {"content-type": "text/plain; charset=utf-8", "upsert": "true"}
+_JSONL_OPTIONS = {"content-type": "application/json; charset=utf-8", "upsert": "true"}
+
+# Cap on clip uploads in flight across all sessions (each holds a worker thread)
+UPLOAD_CONCURRENCY = 8
+_upload_slots = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
 
 async def upload_clip(user_id: str, bot_id: str, clip_num: int, mp3_bytes: bytes) -> None:
     """Upload a single MP3 clip to Supabase Storage."""
     path = f"{user_id}/{bot_id}/clip_{clip_num:04d}.mp3"
     try:
-        await asyncio.to_thread(
-            lambda: _client.storage.from_(BUCKET).upload(
-                path, mp3_bytes, {"content-type": "audio/mpeg"}
-            )
-        )
+        await _run(partial(_bucket.upload, path, mp3_bytes, _CLIP_OPTIONS))
     except Exception:
         log.exception("Failed to upload clip %s", path)
 
 
-async def upload_text_file(user_id: str, bot_id: str, filename: str, text: str) -> None:
-    """Upload a text file (SRT, JSONL, etc.) to Supabase Storage."""
+async def upload_clips(user_id: str, bot_id: str, clips: list[tuple[int, bytes]]) -> None:
+    """Upload a batch of (clip number, MP3) clips concurrently, at most
+    UPLOAD_CONCURRENCY at a time. Failures are logged per clip."""
+    async def _upload(clip_num: int, mp3_bytes: bytes) -> None:
+        async with _upload_slots:
+            await upload_clip(user_id, bot_id, clip_num, mp3_bytes)
+
+    await asyncio.gather(*(_upload(n, mp3_bytes) for n, mp3_bytes in clips))
+
+
+async def upload_text_file(user_id: str, bot_id: str, filename: str, data: bytes) -> None:
+    """Upload a UTF-8 text file (SRT, JSONL, etc.) to Supabase Storage.
+
+    Takes the encoded bytes so a large transcript isn't held as both a
+    str and its encoding while it uploads.
+    """
     path = f"{user_id}/{bot_id}/{filename}"
-    content_type = "text/plain; charset=utf-8"
-    if filename.endswith(".jsonl"):
-        content_type = "application/json; charset=utf-8"
+    options = _JSONL_OPTIONS if filename.endswith(".jsonl") else _TEXT_OPTIONS
     try:
-        await asyncio.to_thread(
-            lambda: _client.storage.from_(BUCKET).upload(
-                path, text.encode("utf-8"), {"content-type": content_type}
-            )
-        )
+        await _run(partial(_bucket.upload, path, data, options))
     except Exception:
         log.exception("Failed to upload text file %s", path)
 
@@ -190,18 +385,17 @@ async def upload_or_update_file(path: str, data: bytes, content_type: str, timeo
     """
     log.info("Uploading %s (%.1f MB)", path, len(data) / 1_000_000)
     await asyncio.wait_for(
-        asyncio.to_thread(
-            lambda: _client.storage.from_(BUCKET).upload(
-                path, data, {"content-type": content_type, "upsert": "true"}
-            )
-        ),
+        _run(partial(
+            _bucket.upload,
+            path, data, {"content-type": content_type, "upsert": "true"},
+        )),
         timeout=timeout,
     )
 
 
 async def admin_list_users() -> list[dict]:
     """Return all users via the Admin API."""
-    resp = await asyncio.to_thread(lambda: _client.auth.admin.list_users())
+    resp = await _run(_client.auth.admin.list_users)
     return [
         {"id": u.id, "email": u.email, "created_at": u.created_at.isoformat() if u.created_at else None}
         for u in resp
@@ -210,10 +404,12 @@ async def admin_list_users() -> list[dict]:
 
 async def admin_create_user(email: str, password: str) -> dict:
     """Create a new user via the Admin API (email auto-confirmed)."""
-    resp = await asyncio.to_thread(
-        lambda: _client.auth.admin.create_user(
-            {"email": email, "password": password, "email_confirm": True}
-        )
+    resp = await _run(
+        partial(
+            _client.auth.admin.create_user,
+            {"email": email, "password": password, "email_confirm": True},
+        ),
+        idempotent=False,
     )
     u = resp.user
     return {"id": u.id, "email": u.email, "created_at": u.created_at.isoformat() if u.created_at else None}
@@ -221,20 +417,93 @@ async def admin_create_user(email: str, password: str) -> dict:
 
 async def admin_delete_user(user_id: str) -> None:
     """Delete a user via the Admin API."""
-    await asyncio.to_thread(lambda: _client.auth.admin.delete_user(user_id))
+    await _run(partial(_client.auth.admin.delete_user, user_id))
+    # Stop accepting the deleted user's cached tokens right away
+    for key in [k for k, (_, user) in _jwt_cache.items() if user["sub"] == user_id]:
+        del _jwt_cache[key]
+
+
+# Signed URLs are reused until SIGNED_URL_REUSE of their lifetime has passed,
+# so a link handed out from the cache always has a useful stretch left.
+# Only successes are cached: a None result still means "doesn't exist yet".
+SIGNED_URL_REUSE = 0.8
+SIGNED_URL_CACHE_MAX_ENTRIES = 4096
+# Paths per create_signed_urls request
+SIGN_BATCH_SIZE = 500
+
+_signed_url_cache: OrderedDict[tuple[str, int], tuple[float, str]] = OrderedDict()
+
+
+def _cached_signed_url(path: str, expires_in: int) -> str | None:
+    key = (path, expires_in)
+    cached = _signed_url_cache.get(key)
+    if cached is None:
+        return None
+    if cached[0] <= time.monotonic():
+        del _signed_url_cache[key]
+        return None
+    _signed_url_cache.move_to_end(key)
+    return cached[1]
+
+
+def _cache_signed_url(path: str, expires_in: int, url: str) -> None:
+    reuse_until = time.monotonic() + expires_in * SIGNED_URL_REUSE
+    _signed_url_cache[(path, expires_in)] = (reuse_until, url)
+    _signed_url_cache.move_to_end((path, expires_in))
+    if len(_signed_url_cache) > SIGNED_URL_CACHE_MAX_ENTRIES:
+        _signed_url_cache.popitem(last=False)
 
 
 async def get_signed_url(path: str, expires_in: int = 3600) -> str | None:
-    """Generate a signed download URL for a storage object (with retry)."""
-    for attempt in range(3):
+    """Generate a signed download URL for a storage object.
+
+    Transient failures are retried by _run(); a missing object fails fast.
+    """
+    url = _cached_signed_url(path, expires_in)
+    if url is not None:
+        return url
+    try:
+        resp = await _run(
+            partial(_bucket.create_signed_url, path, expires_in)
+        )
+        url = resp.get("signedURL") or resp.get("signedUrl")
+        if url:
+            _cache_signed_url(path, expires_in, url)
+        return url
+    except Exception:
+        log.exception("Failed to create signed URL for %s", path)
+    return None
+
+
+async def get_signed_urls(paths: list[str], expires_in: int = 3600) -> dict[str, str]:
+    """Like get_signed_url() for many objects, with one Storage request
+    per SIGN_BATCH_SIZE paths. Missing objects are left out of the result."""
+    urls: dict[str, str] = {}
+    missing = []
+    for path in paths:
+        url = _cached_signed_url(path, expires_in)
+        if url is not None:
+            urls[path] = url
+        else:
+            missing.append(path)
+
+    for i in range(0, len(missing), SIGN_BATCH_SIZE):
+        batch = missing[i:i + SIGN_BATCH_SIZE]
         try:
-            resp = await asyncio.to_thread(
-                lambda: _client.storage.from_(BUCKET).create_signed_url(path, expires_in)
+            resp = await _run(
+                partial(_bucket.create_signed_urls, batch, expires_in)
             )
-            return resp.get("signedURL") or resp.get("signedUrl")
         except Exception:
-            if attempt < 2:
-                await asyncio.sleep(1.0 * (attempt + 1))
-            else:
-                log.exception("Failed to create signed URL for %s", path)
-    return None
+            log.exception("Failed to create %d signed URLs (first: %s)", len(batch), batch[0])
+            continue
+        for item in resp:
+            url = item.get("signedURL") or item.get("signedUrl")
+            if url and not item.get("error"):
+                urls[item["path"]] = url
+                _cache_signed_url(item["path"], expires_in, url)
+    return urls
+
+
+async def download(signed_url: str, timeout: float = 30.0) -> httpx.Response:
+    """GET a signed storage URL over the shared connection (no status check)."""
+    return await _get_http().get(signed_url, timeout=timeout)
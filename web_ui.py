@@ -820,6 +820,29 @@ HTML_PAGE = """\
     <div class="card">
       <div class="card-title">Active Bots</div>
       <div id="bot-list"><div class="empty">No active bots</div></div>
+      <template id="bot-row-tpl">
+        <div class="bot-row">
+          <div class="bot-info">
+            <span class="status-dot"></span>
+            <strong class="mode-label"></strong>
+            <span class="bot-id"></span>
+            <span class="owner-tag"></span>
+            <span class="bot-status" style="color:var(--muted);font-size:.8rem;"></span>
+            <div class="listen-url"></div>
+            <div class="dl-links">
+              <a href="#" class="dl-mp3">Audio MP3</a>
+              <a href="#" class="dl-srt">Subtitles SRT</a>
+              <a href="#" class="dl-transcript">Transcript</a>
+              <a href="#" class="dl-video">Dubbed Video</a>
+              <span class="clip-count" style="color:var(--muted);font-size:.72rem;"></span>
+            </div>
+          </div>
+          <div style="display:flex;align-items:center;gap:.4rem;flex-shrink:0;">
+            <button class="copy-link">Copy Link</button>
+            <button class="stop">Stop</button>
+          </div>
+        </div>
+      </template>
     </div>
 
     <div class="card">
@@ -890,7 +913,6 @@ HTML_PAGE = """\
     mainApp.style.display = "block";
     userEmailEl.textContent = session.user.email || "";
     connect();
-    loadRecordings();
   }
 
   function showAuthError(msg) {
@@ -964,6 +986,7 @@ HTML_PAGE = """\
   var urlInput  = document.getElementById("meeting-url");
   var sourceSel = document.getElementById("source-lang");
   var botList   = document.getElementById("bot-list");
+  var botRowTpl = document.getElementById("bot-row-tpl");
   var recList   = document.getElementById("rec-list");
   var connEl    = document.getElementById("conn-status");
   var errorsEl  = document.getElementById("errors");
@@ -1009,6 +1032,8 @@ HTML_PAGE = """\
       connEl.textContent = "Connected";
       connEl.className = "connected";
       startBtn.disabled = false;
+      // Catch up on anything that finished while disconnected
+      loadRecordings();
     };
 
     ws.onclose = function() {
@@ -1035,6 +1060,8 @@ HTML_PAGE = """\
           }
         }
         renderBots(msg.bots);
+      } else if (msg.type === "recordings_changed") {
+        refreshRecordings();
       } else if (msg.type === "users") {
         renderUsers(msg.users);
       } else if (msg.type === "user_created") {
@@ -1063,69 +1090,115 @@ HTML_PAGE = """\
     return { "Authorization": "Bearer " + accessToken };
   }
 
+  // bot_id -> {node, status, clips} for the rows currently in #bot-list.
+  // Status messages carry the full snapshot; renderBots() diffs it against
+  // these rows so unchanged bots keep their nodes (and Copied! state).
+  var botRows = new Map();
+
   function renderBots(bots) {
     if (!bots || bots.length === 0) {
+      botRows.clear();
       botList.innerHTML = '<div class="empty">No active bots</div>';
       return;
     }
-    var html = "";
-    for (var i = 0; i < bots.length; i++) {
-      var b = bots[i];
-      var shortId = b.bot_id.substring(0, 8);
-      var ownerHtml = (isAdmin && b.user_id) ? ' <span class="owner-tag">user:' + b.user_id.substring(0,8) + '</span>' : '';
-      var isNotes = b.mode === "notes";
-      var isBoth = b.mode === "both";
-      var url = isNotes ? "" : listenUrl(b.target_lang);
-      var dlHtml = "";
-      if (b.clip_count > 0 && !isNotes) {
-        dlHtml = '<div class="dl-links">' +
-          '<a href="#" data-mp3-bot="' + b.bot_id + '" onclick="downloadMp3(\\x27' + b.bot_id + '\\x27);return false;">Audio MP3</a>' +
-          '<a href="#" onclick="downloadFile(\\x27' + b.bot_id + '\\x27,\\x27subtitles.srt\\x27);return false;">Subtitles SRT</a>' +
-          '<a href="#" onclick="downloadFile(\\x27' + b.bot_id + '\\x27,\\x27transcript.jsonl\\x27);return false;">Transcript</a>' +
-          '<a href="#" data-video-bot="' + b.bot_id + '" onclick="downloadVideo(\\x27' + b.bot_id + '\\x27);return false;">Dubbed Video</a>' +
-          '<span style="color:var(--muted);font-size:.72rem;">(' + b.clip_count + ' clips)</span>' +
-        '</div>';
+    if (botRows.size === 0) botList.replaceChildren();  // drop the placeholder
+
+    var ids = new Set();
+    var added = false;
+    for (var i = 0; i < bots.length; i++) ids.add(bots[i].bot_id);
+    botRows.forEach(function(entry, botId) {
+      if (!ids.has(botId)) { entry.node.remove(); botRows.delete(botId); }
+    });
+
+    for (var j = 0; j < bots.length; j++) {
+      var b = bots[j];
+      var entry = botRows.get(b.bot_id);
+      if (!entry) {
+        entry = {node: createBotRow(b), status: "", clips: 0};
+        botRows.set(b.bot_id, entry);
+        added = true;
+      }
+      updateBotRow(entry, b);
+      // Keep snapshot order; moves only rows that are out of place
+      if (botList.children[j] !== entry.node) {
+        botList.insertBefore(entry.node, botList.children[j] || null);
       }
-      var modeLabel = isNotes ? '<strong>MEETING NOTES</strong>' :
-        isBoth ? '<strong>' + b.source_lang.toUpperCase() + ' &rarr; ' + b.target_lang.toUpperCase() + ' + NOTES</strong>' :
-        '<strong>' + b.source_lang.toUpperCase() + ' &rarr; ' + b.target_lang.toUpperCase() + '</strong>';
-      html += '<div class="bot-row">' +
-        '<div class="bot-info">' +
-          '<span class="status-dot ' + b.status + '"></span>' +
-          modeLabel + ' ' +
-          '<span class="bot-id">' + shortId + '</span> ' + ownerHtml +
-          '<span style="color:var(--muted);font-size:.8rem;"> ' + b.status + '</span>' +
-          (url ? '<div class="listen-url">' + url + '</div>' : '') +
-          dlHtml +
-        '</div>' +
-        '<div style="display:flex;align-items:center;gap:.4rem;flex-shrink:0;">' +
-          (url ? '<button class="copy-link" data-url="' + url + '">Copy Link</button>' : '') +
-          '<button class="stop" data-id="' + b.bot_id + '">Stop</button>' +
-        '</div>' +
-      '</div>';
     }
-    botList.innerHTML = html;
-
-    var stopBtns = botList.querySelectorAll("button.stop");
-    for (var j = 0; j < stopBtns.length; j++) {
-      stopBtns[j].addEventListener("click", function() {
-        var botId = this.getAttribute("data-id");
-        ws.send(JSON.stringify({ action: "stop", bot_id: botId }));
-      });
+    if (added) { applyMp3State(); applyVideoState(); }
+  }
+
+  // Fields that never change for a bot are filled in once, here
+  function createBotRow(b) {
+    var row = botRowTpl.content.firstElementChild.cloneNode(true);
+    var isNotes = b.mode === "notes";
+    var isBoth = b.mode === "both";
+    var url = isNotes ? "" : listenUrl(b.target_lang);
+    row.querySelector(".mode-label").textContent = isNotes ? "MEETING NOTES" :
+      b.source_lang.toUpperCase() + " \u2192 " + b.target_lang.toUpperCase() + (isBoth ? " + NOTES" : "");
+    row.querySelector(".bot-id").textContent = b.bot_id.substring(0, 8);
+    var ownerEl = row.querySelector(".owner-tag");
+    if (isAdmin && b.user_id) ownerEl.textContent = "user:" + b.user_id.substring(0, 8);
+    else ownerEl.remove();
+    if (url) {
+      row.querySelector(".listen-url").textContent = url;
+      row.querySelector(".copy-link").dataset.url = url;
+    } else {
+      row.querySelector(".listen-url").remove();
+      row.querySelector(".copy-link").remove();
+    }
+    if (isNotes) {
+      row.querySelector(".dl-links").remove();
+    } else {
+      fillDownloadLinks(row, b.bot_id);
+      row.querySelector(".dl-links").style.display = "none";  // until the first clip
+    }
+    row.querySelector(".stop").dataset.id = b.bot_id;
+    return row;
+  }
+
+  // Status and clip count change while a bot runs; touch only what did
+  function updateBotRow(entry, b) {
+    var row = entry.node;
+    if (b.status !== entry.status) {
+      var dot = row.querySelector(".status-dot");
+      if (entry.status) dot.classList.remove(entry.status);
+      if (b.status) dot.classList.add(b.status);
+      row.querySelector(".bot-status").textContent = b.status;
+      entry.status = b.status;
+    }
+    var dl = row.querySelector(".dl-links");
+    if (dl && b.clip_count !== entry.clips) {
+      dl.style.display = b.clip_count > 0 ? "" : "none";
+      row.querySelector(".clip-count").textContent = "(" + b.clip_count + " clips)";
+      entry.clips = b.clip_count;
     }
+  }
 
-    var copyBtns = botList.querySelectorAll("button.copy-link");
-    for (var k = 0; k < copyBtns.length; k++) {
-      copyBtns[k].addEventListener("click", function() {
-        var btn = this;
-        navigator.clipboard.writeText(btn.getAttribute("data-url")).then(function() {
-          btn.textContent = "Copied!";
-          btn.classList.add("copied");
-          setTimeout(function() { btn.textContent = "Copy Link"; btn.classList.remove("copied"); }, 2000);
-        });
+  function fillDownloadLinks(row, botId) {
+    var mp3 = row.querySelector(".dl-mp3");
+    var video = row.querySelector(".dl-video");
+    mp3.dataset.mp3Bot = botId;
+    video.dataset.videoBot = botId;
+    // Per-link handlers, since applyMp3State()/applyVideoState() replace them
+    mp3.onclick = function() { downloadMp3(botId); return false; };
+    video.onclick = function() { downloadVideo(botId); return false; };
+    row.querySelector(".dl-srt").onclick = function() { downloadFile(botId, "subtitles.srt"); return false; };
+    row.querySelector(".dl-transcript").onclick = function() { downloadFile(botId, "transcript.jsonl"); return false; };
+  }
+
+  botList.addEventListener("click", function(e) {
+    var btn = e.target.closest("button");
+    if (!btn) return;
+    if (btn.classList.contains("stop")) {
+      ws.send(JSON.stringify({ action: "stop", bot_id: btn.dataset.id }));
+    } else if (btn.classList.contains("copy-link")) {
+      navigator.clipboard.writeText(btn.dataset.url).then(function() {
+        btn.textContent = "Copied!";
+        btn.classList.add("copied");
+        setTimeout(function() { btn.textContent = "Copy Link"; btn.classList.remove("copied"); }, 2000);
       });
     }
-  }
+  });
 
   startBtn.addEventListener("click", function() {
     var meetingUrl = urlInput.value.trim();
@@ -1560,12 +1633,13 @@ HTML_PAGE = """\
     }
   });
 
-  // Periodic refresh of recordings (restore link state after rebuild)
-  setInterval(function() {
+  // Reload recordings when the server reports a finished session
+  // (restore link state after rebuild)
+  function refreshRecordings() {
     loadRecordings();
     if (isAdmin) { loadDashboard(); loadAdminSessions(); }
     setTimeout(function() { applyMp3State(); applyVideoState(); }, 500);
-  }, 15000);
+  }
 })();
 </script>
 </body>
@@ -1867,6 +1941,35 @@ LISTEN_PAGE = """\
   var queue = [];
   var playing = false;
   var clipsPlayed = 0;
+  var clips = {};  // clip id -> item still receiving audio
+  var canStream = !!(window.MediaSource && MediaSource.isTypeSupported("audio/mpeg"));
+
+  // Stream a clip through MediaSource so playback starts with the first chunk
+  function streamingUrl(item) {
+    var ms = new MediaSource();
+    ms.addEventListener("sourceopen", function() {
+      var sb = ms.addSourceBuffer("audio/mpeg");
+      var appended = 0;
+      function pump() {
+        if (sb.updating || ms.readyState !== "open") return;
+        if (appended < item.chunks.length) {
+          sb.appendBuffer(item.chunks[appended++]);
+        } else if (item.done) {
+          ms.endOfStream();
+        }
+      }
+      sb.addEventListener("updateend", pump);
+      item.onupdate = pump;
+      pump();
+    });
+    return URL.createObjectURL(ms);
+  }
+
+  // Fallback: wait for the whole clip, then play it as a Blob
+  function whenComplete(item, cb) {
+    if (item.done) { cb(); return; }
+    item.onupdate = function() { if (item.done) cb(); };
+  }
 
   function playNext() {
     if (queue.length === 0) {
@@ -1883,18 +1986,28 @@ LISTEN_PAGE = """\
     subtitleEl.textContent = item.translated;
     originalEl.textContent = item.original;
 
-    var audio = new Audio("data:audio/mp3;base64," + item.mp3);
+    if (canStream) {
+      playUrl(streamingUrl(item));
+    } else {
+      whenComplete(item, function() {
+        playUrl(URL.createObjectURL(new Blob(item.chunks, {type: "audio/mpeg"})));
+      });
+    }
+  }
+
+  function playUrl(url) {
+    var audio = new Audio(url);
+    function finish() {
+      URL.revokeObjectURL(url);
+      playNext();
+    }
     audio.onended = function() {
       clipsPlayed++;
       clipCountEl.textContent = clipsPlayed + " clip" + (clipsPlayed === 1 ? "" : "s") + " played";
-      playNext();
-    };
-    audio.onerror = function() {
-      playNext();
+      finish();
     };
-    audio.play().catch(function() {
-      playNext();
-    });
+    audio.onerror = finish;
+    audio.play().catch(finish);
   }
 
   function enqueue(item) {
@@ -1913,6 +2026,7 @@ LISTEN_PAGE = """\
   function connect() {
     if (ws && ws.readyState <= 1) return;
     ws = new WebSocket(wsUrl());
+    ws.binaryType = "arraybuffer";
 
     ws.onopen = function() {
       statusEl.textContent = "Connected";
@@ -1922,16 +2036,43 @@ LISTEN_PAGE = """\
     ws.onclose = function() {
       statusEl.textContent = "Disconnected";
       statusEl.className = "status-badge disconnected";
+      // Clips cut off mid-stream will never get audio_end; finish them with
+      // what arrived so the playback queue doesn't stall behind them
+      Object.keys(clips).forEach(function(id) {
+        var item = clips[id];
+        item.done = true;
+        if (item.onupdate) item.onupdate();
+      });
+      clips = {};
       reconnectTimer = setTimeout(connect, 3000);
     };
 
     ws.onerror = function() { ws.close(); };
 
     ws.onmessage = function(ev) {
+      var item;
+      if (ev.data instanceof ArrayBuffer) {
+        // Binary frame: 4-byte clip id followed by MP3 data
+        if (ev.data.byteLength <= 4) return;
+        item = clips[new DataView(ev.data).getUint32(0)];
+        if (!item) return;
+        item.chunks.push(ev.data.slice(4));
+        if (item.onupdate) item.onupdate();
+        return;
+      }
       var msg;
       try { msg = JSON.parse(ev.data); } catch(e) { return; }
-      if (msg.type === "audio" && msg.mp3) {
-        enqueue({mp3: msg.mp3, translated: msg.translated || "", original: msg.original || ""});
+      if (msg.type === "audio_start") {
+        item = {chunks: [], done: false, onupdate: null,
+                translated: msg.translated || "", original: msg.original || ""};
+        clips[msg.id] = item;
+        enqueue(item);
+      } else if (msg.type === "audio_end") {
+        item = clips[msg.id];
+        if (!item) return;
+        delete clips[msg.id];
+        item.done = true;
+        if (item.onupdate) item.onupdate();
       }
     };
   }